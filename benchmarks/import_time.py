@@ -0,0 +1,84 @@
+"""Checks cold-start import cost of the solve paths against a fixed budget.
+
+Each check runs in a fresh interpreter, so nothing is cached in sys.modules. Exits with
+status 1 if a check is over budget or loads matplotlib.
+
+    python benchmarks/import_time.py [--budget 0.5] [--repeat 5]
+"""
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+SRC_PATH: str = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+
+CHECKS: dict[str, str] = {
+    "import WordleSolver.algo": "import WordleSolver.algo",
+    "Real-time path": (
+        "from WordleSolver.solver import Solver\n"
+        "from WordleSolver.algo import Context, Entropy\n"
+        "from WordleSolver.display import Console\n"
+        "solver = Solver(Context(), 5e-7)\n"
+        "Entropy().predict(solver.solver_data, {})\n"
+        "Console()\n"
+    ),
+}
+
+PROBE: str = """
+import sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<check>", "exec"))
+print(time.perf_counter() - start, "matplotlib" in sys.modules)
+"""
+
+
+def run(code: str) -> tuple[float, bool]:
+    """Runs code in a fresh interpreter, returns its wall time and if matplotlib was loaded."""
+    env: dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, (SRC_PATH, env.get("PYTHONPATH"))))
+    output: str = subprocess.run(
+        [sys.executable, "-c", PROBE.format(code=code)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[-2]), output[-1] == "True"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=0.5, help="Seconds per check.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float | bool]] = {}
+    for name, code in CHECKS.items():
+        # Warm-up run to exclude first-time cache builds from the measurement.
+        run(code)
+        timings: list[tuple[float, bool]] = [run(code) for _ in range(args.repeat)]
+        best: float = min(t for t, _ in timings)
+        loads_mpl: bool = any(m for _, m in timings)
+        results[name] = {
+            "seconds": best,
+            "matplotlib": loads_mpl,
+            "ok": best <= args.budget and not loads_mpl,
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            status: str = "OK" if result["ok"] else "FAIL"
+            print(
+                f"{status:<4} {name:<28} {result['seconds'] * 1000:8.1f} ms"
+                f"  (budget {args.budget * 1000:.0f} ms, matplotlib: {result['matplotlib']})"
+            )
+    return 0 if all(r["ok"] for r in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+"""Times the solver's core kernels and full games on a fixed word list against a baseline.
+
+Uses benchmarks/words.txt (1500 words) and fixed seeds, so every run does the same work.
+Exits with status 1 if a benchmark is slower than the baseline by more than --threshold
+plus this run's own noise (the spread between its rounds), if an algorithm's average shot
+count changed, or if a benchmark has no baseline (save one after adding an algorithm).
+
+    python benchmarks/kernels.py [--repeat 5] [--threshold 0.25] [--save-baseline]
+"""
+
+import os
+import sys
+import json
+import random
+import argparse
+import dataclasses
+import tempfile
+from time import perf_counter
+from typing import Callable
+
+BENCH_PATH: str = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, "..", "src"))
+
+import numpy as np
+from WordleSolver.algo import Context, Auto, Entropy, RandomFiltered
+from WordleSolver.batch import Batch
+from WordleSolver.cache import OpenerCache, PatternCache
+from WordleSolver.data_structures import SolverData, BatchData
+from WordleSolver.index import WordIndex
+from WordleSolver.patterns import Pattern
+from WordleSolver.utils import EntropyCalc
+
+WORDS_PATH: str = os.path.join(BENCH_PATH, "words.txt")
+BASELINE_PATH: str = os.path.join(BENCH_PATH, "baseline.json")
+SEED: int = 0
+GAMES: int = 500
+MIN_ROUND: float = 0.2  # Seconds, kernels are called enough times per round to last this.
+
+
+def get_data(cache_path: str) -> SolverData:
+    """Builds solver data for the bundled word list, with openers and caches in cache_path."""
+    with open(WORDS_PATH, "r") as FILE:
+        words: tuple[str, ...] = tuple(FILE.read().split())
+    data: SolverData = SolverData(words, {w: 1.0 for w in words}, 0.0, 1)
+    data.patterns = Pattern.get_matrix(Pattern.to_array(words), Pattern.to_array(words))
+    data.word_index = WordIndex(words)
+    data.priors = np.full(len(words), 0.5)
+    data.cache_path = cache_path
+    data.cache_key = PatternCache.get_key(words, 0.0).hex()
+    data.openers, data.second_guesses = OpenerCache.get_openers(cache_path, data, 0.0)
+    data.opener_variant = OpenerCache.get_variant(data)
+    return data
+
+
+def get_boards(data: SolverData, turns: int, count: int) -> list[dict]:
+    """Returns boards of Entropy games (seeded answers) after the given number of turns."""
+    rng: random.Random = random.Random(SEED)
+    boards: list[dict] = []
+    while len(boards) < count:
+        answer: str = rng.choice(data.considered_words)
+        board: dict[str, tuple[int, ...]] = {}
+        algorithm: Entropy = Entropy()
+        for _ in range(turns):
+            guess: str = algorithm.predict(data, board)[0][0]
+            board[guess] = Pattern.get_feedback(guess, answer)
+            if guess == answer:
+                break
+        else:
+            boards.append(board)
+    return boards
+
+
+def measure(func: Callable[[], object], repeat: int) -> tuple[float, float]:
+    """Returns the best mean seconds per call of func over repeat rounds, each calling it
+    enough times to last MIN_ROUND, and the noise: how much slower the median round was."""
+    number: int = 1
+    while True:
+        start: float = perf_counter()
+        for _ in range(number):
+            func()
+        elapsed: float = perf_counter() - start
+        if MIN_ROUND <= elapsed:
+            break
+        number = max(number * 2, int(number * MIN_ROUND / max(elapsed, 1e-9)) + 1)
+    rounds: list[float] = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        rounds.append((perf_counter() - start) / number)
+    return get_spread(rounds)
+
+
+def get_spread(rounds: list[float]) -> tuple[float, float]:
+    """Returns the best of the rounds and how much slower the median was, relative."""
+    best: float = min(rounds)
+    return best, float(np.median(rounds)) / best - 1
+
+
+def get_kernels(data: SolverData) -> dict[str, Callable[[], object]]:
+    """Returns each kernel benchmark's function."""
+    rng: random.Random = random.Random(SEED)
+    words: tuple[str, ...] = data.considered_words
+    pairs: list[tuple[str, str]] = [(rng.choice(words), rng.choice(words)) for _ in range(100)]
+    evaluation: Auto = Auto()
+
+    def evaluate() -> None:
+        for guess, answer in pairs:
+            evaluation.evaluate({guess: Pattern.get_empty()}, answer)
+
+    row: np.ndarray = np.asarray(data.patterns[rng.randrange(len(words))])
+    second: list[dict] = get_boards(data, 1, 20)
+    third: list[dict] = get_boards(data, 2, 20)
+
+    # Fresh algorithms (no carried-over state), and no precomputed second guesses.
+    no_openers: SolverData = dataclasses.replace(data, opener_variant="")
+    all_ids: np.ndarray = np.arange(len(words))
+    return {
+        "Auto.evaluate (100 boards)": evaluate,
+        "EntropyCalc.get_entropy": lambda: EntropyCalc.get_entropy(row),
+        "RandomFiltered.predict (turn 2)": lambda: [
+            RandomFiltered().predict(data, b) for b in second
+        ],
+        "EntropyCalc.get_ranked (all words)": lambda: EntropyCalc.get_ranked(
+            data.patterns, all_ids, all_ids, letters=data.word_index.letters
+        ),
+        "OpenerCache.build": lambda: OpenerCache.build(data),
+        "Entropy.predict (turn 2, uncached)": lambda: [
+            Entropy().predict(no_openers, b) for b in second
+        ],
+        "Entropy.predict (turn 3)": lambda: [Entropy().predict(data, b) for b in third],
+    }
+
+
+def get_games(data: SolverData, repeat: int) -> dict[str, tuple[float, float, float]]:
+    """Plays batches of GAMES seeded games per algorithm in this process, returns (best
+    seconds per game over repeat rounds, their noise, average shots) for each."""
+    results: dict[str, tuple[float, float, float]] = {}
+    answers: tuple[str, ...] = tuple(
+        random.Random(SEED).choices(data.considered_words, k=GAMES)
+    )
+    for algorithm in Context().get_algorithms():
+        play: Callable[[], BatchData] = lambda: Batch.run(
+            algorithm, data, answers, workers=1, seed=SEED
+        )
+        seconds, noise = measure(play, repeat)
+        results[algorithm] = (seconds / GAMES, noise, play().mean)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown over the baseline (default: 0.25 = 25%%).",
+    )
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store this run as the baseline (timings are machine specific).",
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as cache_path:
+        data: SolverData = get_data(cache_path)
+        for name, func in get_kernels(data).items():
+            seconds, noise = measure(func, args.repeat)
+            results[name] = {"seconds": seconds, "noise": noise}
+        for algorithm, (seconds, noise, mean) in get_games(data, args.repeat).items():
+            results[f"{algorithm} game"] = {
+                "seconds": seconds,
+                "noise": noise,
+                "shots": mean,
+            }
+
+    baseline: dict[str, dict[str, float]] = {}
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r") as FILE:
+            baseline = json.load(FILE)
+
+    failed: bool = False
+    for name, result in results.items():
+        base: dict[str, float] | None = baseline.get(name)
+        result["ratio"] = result["seconds"] / base["seconds"] if base else 1.0
+        result["ok"] = (
+            (base is not None or not baseline)
+            and result["ratio"] <= 1 + args.threshold + result["noise"]
+            and (base is None or base.get("shots") == result.get("shots"))
+        )
+        failed |= not result["ok"]
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as FILE:
+            json.dump(
+                {
+                    name: {k: v for k, v in r.items() if k in ("seconds", "shots")}
+                    for name, r in results.items()
+                },
+                FILE,
+                indent=2,
+            )
+            FILE.write("\n")
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            status: str = "OK" if result["ok"] else "FAIL"
+            if baseline and name not in baseline:
+                status = "NEW"
+            shots: str = f"  {result['shots']:.3f} shots" if "shots" in result else ""
+            print(
+                f"{status:<4} {name:<36} {result['seconds'] * 1000:10.3f} ms"
+                f"  x{result['ratio']:.2f}{shots}"
+            )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+"""Plays every answer once per algorithm and diffs the guess paths against golden files.
+
+Games are seeded per answer (see Batch.run), so a change that keeps the solver's results
+must reproduce the golden paths exactly. Multi-Board Entropy is also played on seeded
+groups of MULTI_BOARDS answers. Exits with status 1 if any game differs.
+
+    python benchmarks/regression.py [-a entropy ...] [--soft] [--update]
+"""
+
+import os
+import sys
+import gzip
+import json
+import argparse
+import dataclasses
+import tempfile
+from time import perf_counter
+
+BENCH_PATH: str = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_PATH, "..", "src"))
+
+from WordleSolver.algo import Context
+from WordleSolver.batch import Batch
+from WordleSolver.cache import OpenerCache, TranspositionTable
+from WordleSolver.cli import CLI
+from WordleSolver.data_structures import BatchData, SolverData
+from WordleSolver.results import ResultWriter
+from WordleSolver.solver import Solver
+
+GOLDEN_PATH: str = os.path.join(BENCH_PATH, "golden")
+SHOWN: int = 10  # Differences printed per algorithm.
+MULTI_BOARDS: int = 4  # Boards of the multi-board golden (Quordle).
+
+
+def get_path(directory: str, algorithm: str, data: SolverData) -> str:
+    """Returns the golden file of an algorithm for the data's rules."""
+    variant: str = "hard" if data.hard_mode else "soft"
+    if data.word_length != 5:
+        variant += f"-l{data.word_length}"
+    if data.boards != 1:
+        variant += f"-b{data.boards}"
+    name: str = algorithm.lower().replace(" ", "-")
+    return os.path.join(directory, f"{name}-{variant}.txt.gz")
+
+
+def play(algorithm: str, data: SolverData, workers: int | None, seed: int) -> dict[int, str]:
+    """Plays every considered word once, returns each case's answer and guesses as a line."""
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "games.jsonl")
+        with ResultWriter(path) as writer:
+            result: BatchData = Batch.run(
+                algorithm, data, workers=workers, seed=seed, writer=writer
+            )
+        print(
+            f"{algorithm}: {result.games} games, {result.mean:.3f} shots, "
+            f"{result.wall_time:.2f} s",
+            file=sys.stderr,
+        )
+        with open(path, "r") as FILE:
+            games: list[dict] = [json.loads(line) for line in FILE]
+    return {g["case"]: " ".join([g["answer"], *g["guesses"]]) for g in games}
+
+
+def load(path: str) -> tuple[dict[str, str], dict[int, str]]:
+    """Reads a golden file, returns its header fields and its lines by case."""
+    with gzip.open(path, "rt") as FILE:
+        header: dict[str, str] = json.loads(FILE.readline())
+        games: dict[int, str] = {}
+        for line in FILE:
+            case, _, path_line = line.rstrip("\n").partition(" ")
+            games[int(case)] = path_line
+    return header, games
+
+
+def save(path: str, header: dict[str, str], games: dict[int, str]) -> None:
+    """Writes a golden file (gzip text, the header then "case answer guesses..." lines)."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # mtime=0 keeps the file identical when the games are.
+    with open(path, "wb") as RAW, gzip.GzipFile(fileobj=RAW, mode="wb", mtime=0) as FILE:
+        FILE.write((json.dumps(header) + "\n").encode("ascii"))
+        for case in sorted(games):
+            FILE.write(f"{case} {games[case]}\n".encode("ascii"))
+
+
+def compare(golden: dict[int, str], games: dict[int, str]) -> list[str]:
+    """Returns a description of every case that differs from the golden file."""
+    differences: list[str] = []
+    for case in sorted(golden.keys() | games.keys()):
+        expected: str | None = golden.get(case)
+        found: str | None = games.get(case)
+        if expected != found:
+            differences.append(f"case {case}: golden [{expected}], now [{found}]")
+    return differences
+
+
+def main() -> int:
+    context: Context = Context()
+    algorithms: dict[str, str] = CLI.get_algorithms(context)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-a",
+        "--algorithm",
+        action="append",
+        choices=tuple(algorithms),
+        help="Algorithm to check, repeatable (default: all).",
+    )
+    parser.add_argument("-t", "--threshold", type=float, default=5e-7)
+    parser.add_argument("--soft", action="store_true")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--golden", default=GOLDEN_PATH, help="Golden file directory.")
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="Record this run as the golden files instead of comparing.",
+    )
+    args = parser.parse_args()
+
+    solver: Solver = Solver(context, args.threshold, hard_mode=not args.soft)
+    data: SolverData = solver.solver_data
+
+    runs: list[tuple[str, int]] = [(algorithms[n], 1) for n in args.algorithm or algorithms]
+    if any(algorithm == "Multi-Board Entropy" for algorithm, _ in runs):
+        runs.append(("Multi-Board Entropy", MULTI_BOARDS))
+
+    failed: bool = False
+    start: float = perf_counter()
+    for algorithm, boards in runs:
+        # A fresh table per run, so no algorithm replays another's cached rankings.
+        run_data: SolverData = dataclasses.replace(
+            data,
+            boards=boards,
+            allowed_guesses=Context.ALLOWED_GUESSES + boards - 1,
+            transpositions=TranspositionTable(),
+        )
+        header: dict[str, str] = {
+            "algorithm": algorithm,
+            "variant": OpenerCache.get_variant(run_data),
+            "key": run_data.cache_key,
+            "seed": str(args.seed),
+        }
+        label: str = algorithm
+        if boards != 1:
+            header["boards"] = str(boards)
+            label += f" ({boards} boards)"
+        games: dict[int, str] = play(algorithm, run_data, args.workers, args.seed)
+        path: str = get_path(args.golden, algorithm, run_data)
+        if args.update or not os.path.exists(path):
+            save(path, header, games)
+            print(f"RECORDED {label}: {path}")
+            continue
+
+        golden_header, golden = load(path)
+        if golden_header != header:
+            print(f"FAIL {label}: golden file is for {golden_header}, run is {header}")
+            failed = True
+            continue
+        differences: list[str] = compare(golden, games)
+        failed |= bool(differences)
+        print(f"{'FAIL' if differences else 'OK'}   {label}: {len(differences)} differ")
+        for line in differences[:SHOWN]:
+            print(f"    {line}")
+    print(f"Total: {perf_counter() - start:.2f} s", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
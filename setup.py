@@ -4,6 +4,6 @@ setup(
     version='1.0.0',
     packages=find_packages(where='data'),
     package_dir={'': 'data'},
-    package_data={'WordleSolver': ['words.txt']},
+    package_data={'WordleSolver': ['words.txt', 'freqs-*.bin']},
     include_package_data=True,
 )
\ No newline at end of file
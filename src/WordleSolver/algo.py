@@ -2,103 +2,213 @@ import os
 import re
 import random
 from abc import ABC, abstractmethod
-from typing import Tuple, Type, Dict, Set, List
-from WordleSolver.data_structures import SolverData, RuntimeData
-from WordleSolver.display import Display, Console, MPL
-from WordleSolver.utils import EntropyCalc, WordVector
-from itertools import product
-from time import sleep
+import numpy as np
+from time import perf_counter
+from typing import Callable, Sequence, Tuple, Type, TYPE_CHECKING
+from WordleSolver.cache import OpenerCache, TranspositionTable
+from WordleSolver.data_structures import SolverData, RuntimeData, TurnData
+from WordleSolver.patterns import Pattern
+from WordleSolver.state import GameState
+from WordleSolver.tree import DecisionTree
+from WordleSolver.utils import EntropyCalc
+
+if TYPE_CHECKING:
+    from WordleSolver.display import Display, RenderScheduler
+    from WordleSolver.metrics import Metrics
 
 
 class Context:  # TODO
+    ALLOWED_GUESSES: int = 6
+    MIN_RENDER_INTERVAL: float = 100  # Milliseconds.
+
     def get_algorithms(self: "Context") -> dict[str, Type["Algorithm"]]:
         return {
             "Random": Random,
             "Random Filtered": RandomFiltered,
             "Entropy": Entropy,
+            "Decision Tree": Tree,
+            "Multi-Board Entropy": MultiEntropy,
         }
 
     def get_modes(
         self: "Context",
-    ) -> Tuple[str, str]:
-        return ("Pre-defined", "Real-time")
+    ) -> Tuple[str, ...]:
+        return ("Pre-defined", "Real-time", "Batch", "Adversarial")
 
     def get_evals(self: "Context") -> dict[str, Type["Evaluation"]]:
         return {
             "Pre-defined": Auto,
             "Real-time": User,
+            "Batch": Auto,
+            "Adversarial": Adversarial,
         }
 
     def execute(self: "Context", algorithm: str, mode: str, data: SolverData) -> None:
         """Entry point for execution."""
 
+        if mode == "Batch":
+            from WordleSolver.batch import Batch
+
+            Batch.display(Batch.run(algorithm, data))
+            return
+
+        # Imported here so that solving without a display never loads matplotlib.
+        from WordleSolver.display import Console, MPL, RenderScheduler
+
         available_algos: dict[str, Type[Algorithm]] = self.get_algorithms()
         available_evals: dict[str, Type[Evaluation]] = self.get_evals()
 
         ALGORITHM: Algorithm = available_algos[algorithm]()
         EVALUATION: Evaluation = available_evals[mode]()
-        DISPLAY: Display = Console() if mode == "Real-time" else MPL()
-        ALLOWED_GUESSES: int = 6
+        DISPLAY: Display = Console() if mode == "Real-time" else MPL(data.allowed_guesses)
 
         # Stores shot-counts, success/failures, number of cases ran, nth_guess dist
-        run_data: RuntimeData = RuntimeData([], 0, 0, 0, algorithm)
+        run_data: RuntimeData = RuntimeData(
+            0, 0, 0, algorithm, [0] * (data.allowed_guesses + 1)
+        )
 
-        # Answers for this run.
-        case_data: list[str] = [
-            random.choice(data.considered_words) for _ in range(data.case_size)
-        ]
+        # Redraws are throttled, update_interval is the minimum time between them.
+        scheduler: RenderScheduler = RenderScheduler(
+            max(data.update_interval, self.MIN_RENDER_INTERVAL) / 1000,
+            data.render_every,
+        )
 
         for i in range(data.case_size):
-
-            board: dict[str, Tuple[int, ...]] = {}
-            attempts: int = 0
-            is_success: bool = False
-            for j in range(ALLOWED_GUESSES):
-
-                # Predict.
-                guesses: Tuple[Tuple[str, float], ...] = ALGORITHM.predict(data, board)
-
-                # Set guess (Auto/User Input).
-                # -2 = empty, -1 = absent, 0 = present, 1 = correct
-                board[EVALUATION.guess(guesses, type(ALGORITHM) == Entropy)] = (
-                    -2,
-                    -2,
-                    -2,
-                    -2,
-                    -2,
-                )
-
-                # Get feedback/evaluation of move. (Auto/User Eval)
-                EVALUATION.evaluate(board, case_data[i])
-
-                if type(DISPLAY) == Console:
-                    DISPLAY.display(run_data, board, case_data[i])
-
-                # Success.
-                if (1, 1, 1, 1, 1) in set(board.values()):
-                    attempts = j + 1
-                    is_success = True
-                    break
-
-                # Failure.
-                elif j == 5:
-                    attempts = 7
-                    is_success = False
-                    break
+            # Answers for this case (one per board), drawn as the run goes.
+            answers: Tuple[str, ...]
+            if isinstance(EVALUATION, Adversarial):
+                answers = (Adversarial.get_placeholder(data.word_length),)
+            elif data.boards == 1:
+                answers = (random.choice(data.considered_words),)
+            else:
+                answers = tuple(random.sample(data.considered_words, data.boards))
+            answer: str = " ".join(answers)
+
+            attempts, boards = self.play_boards(
+                ALGORITHM,
+                EVALUATION,
+                data,
+                answers,
+                (
+                    (lambda b: DISPLAY.display(run_data, b, answer))
+                    if type(DISPLAY) == Console
+                    else None
+                ),
+            )
+            board: dict[str, Tuple[int, ...]] = Context.merge_boards(
+                boards, data.word_length
+            )
 
             # Update data.
-            run_data.shots.append(attempts)
+            run_data.histogram[attempts - 1] += 1
+            run_data.shot_sum += attempts
             run_data.case += 1
 
-            if is_success:
+            if attempts <= data.allowed_guesses:
                 run_data.successes += 1
             else:
                 run_data.failures += 1
 
-            DISPLAY.display(run_data, board, case_data[i])
+            if type(DISPLAY) == Console or scheduler.is_due(
+                run_data.case, data.case_size
+            ):
+                start: float = perf_counter()
+                DISPLAY.display(run_data, board, answer)
+                if data.metrics is not None:
+                    data.metrics.add("display", perf_counter() - start)
 
-            # Wait interval (Convert milliseconds to seconds).
-            sleep(data.update_interval / 1000)
+    def play(
+        self: "Context",
+        algorithm: "Algorithm",
+        evaluation: "Evaluation",
+        data: SolverData,
+        answer: str,
+        on_turn: Callable[[dict[str, Tuple[int, ...]]], None] | None = None,
+    ) -> Tuple[int, dict[str, Tuple[int, ...]]]:
+        """Plays a single game, returns the shot count (data.allowed_guesses + 1 on
+        failure) and the final board."""
+        shots, boards = self.play_boards(algorithm, evaluation, data, (answer,), on_turn)
+        return shots, boards[0]
+
+    def play_boards(
+        self: "Context",
+        algorithm: "Algorithm",
+        evaluation: "Evaluation",
+        data: SolverData,
+        answers: Sequence[str],
+        on_turn: Callable[[dict[str, Tuple[int, ...]]], None] | None = None,
+    ) -> Tuple[int, list[dict[str, Tuple[int, ...]]]]:
+        """Plays one game on a board per answer (Quordle, Octordle), each guess evaluated
+        on every unsolved board. Returns the shot count until all boards are solved
+        (data.allowed_guesses + 1 on failure) and the final boards."""
+        boards: list[dict[str, Tuple[int, ...]]] = [{} for _ in answers]
+        unsolved: list[int] = list(range(len(answers)))
+        evaluation.start(data)
+        metrics: Metrics | None = data.metrics
+        table: TranspositionTable | None = data.transpositions
+        if metrics is not None and table is not None:
+            hits, misses = table.hits, table.misses
+        solved: Tuple[int, ...] = (1,) * data.word_length
+        for j in range(data.allowed_guesses):
+            if metrics is not None:
+                metrics.start_turn(" ".join(answers), j + 1)
+                start: float = perf_counter()
+
+            # Predict.
+            guesses: Tuple[Tuple[str, float], ...] = algorithm.predict_boards(
+                data, [boards[b] for b in unsolved]
+            )
+            if metrics is not None:
+                turn: TurnData = metrics.turns[-1]
+                turn.predict += perf_counter() - start - turn.filter
+
+            # Set guess (Auto/User Input).
+            # -2 = empty, -1 = absent, 0 = present, 1 = correct
+            guess: str = evaluation.guess(guesses, isinstance(algorithm, Entropy))
+            if metrics is not None:
+                start = perf_counter()
+
+            # Get feedback/evaluation of move. (Auto/User Eval)
+            for b in unsolved:
+                boards[b][guess] = Pattern.get_empty(data.word_length)
+                evaluation.evaluate(boards[b], answers[b])
+            if metrics is not None:
+                metrics.add("evaluate", perf_counter() - start)
+
+            if on_turn is not None:
+                if metrics is not None:
+                    start = perf_counter()
+                on_turn(Context.merge_boards(boards, data.word_length))
+                if metrics is not None:
+                    metrics.add("display", perf_counter() - start)
+
+            # Success.
+            unsolved = [b for b in unsolved if boards[b][guess] != solved]
+            if not unsolved:
+                break
+        else:
+            j = data.allowed_guesses
+
+        if metrics is not None and table is not None:
+            metrics.table_hits += table.hits - hits
+            metrics.table_misses += table.misses - misses
+
+        # Failure counts as allowed_guesses + 1.
+        return j + 1, boards
+
+    @staticmethod
+    def merge_boards(
+        boards: Sequence[dict[str, Tuple[int, ...]]], length: int = 5
+    ) -> dict[str, Tuple[int, ...]]:
+        """Returns the boards of a game as one, each guess mapped to the feedback of every
+        board in turn (boards solved before the guess as all correct)."""
+        if len(boards) == 1:
+            return dict(boards[0])
+        solved: Tuple[int, ...] = (1,) * length
+        return {
+            guess: sum((board.get(guess, solved) for board in boards), ())
+            for guess in max(boards, key=len)
+        }
 
 
 class Evaluation(ABC):
@@ -118,6 +228,9 @@ class Evaluation(ABC):
         """Evaluates a guess based on feedback."""
         pass
 
+    def start(self: "Evaluation", data: SolverData) -> None:
+        """Called before each game."""
+
 
 class User(Evaluation):  # TODO
     def guess(
@@ -132,7 +245,9 @@ class User(Evaluation):  # TODO
             user_input: str = input("\nEnter your guess: ").lower()
             if not user_input.isalpha():
                 continue
-            elif user_input.lower() in [g[0] for g in guesses] or len(user_input) == 5:
+            elif user_input.lower() in [g[0] for g in guesses] or len(user_input) == len(
+                guesses[0][0]
+            ):
                 return user_input.lower()
 
     def evaluate(
@@ -142,13 +257,13 @@ class User(Evaluation):  # TODO
     ) -> None:
         for entry in board.keys():
             os.system("cls")
-            if board[entry] == (-2, -2, -2, -2, -2):
-                evaluation: list[int] = [-2, -2, -2, -2, -2]
+            if -2 in board[entry]:
+                evaluation: list[int] = list(Pattern.get_empty(len(entry)))
                 while True:
                     os.system("cls")
                     print("Syntax: [Gray: -1, Yellow: 0, Green: 1]")
                     user_input: str = input("Enter feedback (e.g. -1 0 1 0 0): ")
-                    pattern: str = r"(-1|0|1)(\s-1|\s0|\s1){4}"
+                    pattern: str = rf"(-1|0|1)(\s-1|\s0|\s1){{{len(entry) - 1}}}"
                     if re.fullmatch(pattern, user_input):
                         evaluation = [int(n) for n in user_input.split()]
                         break
@@ -170,31 +285,59 @@ class Auto(Evaluation):  # TODO
         board: dict[str, Tuple[int, ...]],
         answer: str,
     ) -> None:
-        answer_count: WordVector = WordVector(answer)
         for entry in board.keys():
-            if board[entry] == (-2, -2, -2, -2, -2):
-                evaluation: list[int] = [-2, -2, -2, -2, -2]
-                seen: Dict[str, int] = {}
-                for i, chr in enumerate(entry):
-                    if chr not in seen:
-                        seen[chr] = 1
-                    else:
-                        seen[chr] += 1
-
-                    within_count: bool = (
-                        seen[chr]
-                        <= answer_count.get_vector()[WordVector.map_to_num[chr]]
-                    )
-                    if within_count and chr == answer[i]:
-                        evaluation[i] = 1
-                    elif within_count and chr in answer and chr != answer[i]:
-                        evaluation[i] = 0
-                    else:
-                        evaluation[i] = -1
-                board[entry] = tuple(evaluation)
+            if -2 in board[entry]:
+                board[entry] = Pattern.get_feedback(entry, answer)
+
+
+class Adversarial(Auto):
+    """Has no fixed answer: after each guess, gives the feedback that keeps the most
+    candidates (Absurdle). One game stresses an algorithm the way its hardest answers do,
+    though greedily, so an exhaustive run can still find answers that take longer.
+
+    Plays one board only: greedy adversaries on several boards would all give the same
+    feedback and be solved by the same guess."""
+
+    def __init__(self: "Adversarial") -> None:
+        self.data: SolverData | None = None
+        self.states: dict[int, GameState] = {}
+
+    def start(self: "Adversarial", data: SolverData) -> None:
+        if data.boards != 1:
+            raise ValueError("Adversarial games are played on one board.")
+        self.data = data
+        self.states = {}
+
+    @staticmethod
+    def get_placeholder(length: int) -> str:
+        """Returns the answer shown and recorded for a game, which has none."""
+        return "*" * length
+
+    def evaluate(
+        self: "Evaluation",
+        board: dict[str, Tuple[int, ...]],
+        answer: str,
+    ) -> None:
+        state: GameState | None = self.states.get(id(board))
+        if state is None:
+            state = self.states[id(board)] = GameState(self.data)
+        solved: int = Pattern.get_solved(self.data.word_length)
+        for entry in board.keys():
+            if -2 in board[entry]:
+                row: np.ndarray = state.get_row(entry)
+                # Sorted, so the solved pattern (the highest id) is last if it occurs.
+                ids, counts = np.unique(row, return_counts=True)
+                # A tie with the solved bucket (of one) goes to another bucket.
+                if ids[-1] == solved and counts[-1] < counts.sum():
+                    counts[-1] = 0
+                board[entry] = Pattern.decode(int(ids[np.argmax(counts)]), len(entry))
+                state.narrow(entry, board[entry], row)
 
 
 class Algorithm(ABC):
+    def __init__(self: "Algorithm") -> None:
+        self.state: GameState | None = None
+
     @abstractmethod
     def predict(
         self: "Algorithm", data: SolverData, board: dict[str, Tuple[int, ...]]
@@ -202,6 +345,30 @@ class Algorithm(ABC):
         """Returns a tuple of tuples of the predictions along with their prediction value
         for a given Wordle board until failure or success"""
 
+    def prepare(self: "Algorithm", data: SolverData) -> None:
+        """Builds anything the algorithm precomputes, before games are played."""
+
+    def predict_boards(
+        self: "Algorithm", data: SolverData, boards: list[dict[str, Tuple[int, ...]]]
+    ) -> Tuple[Tuple[str, float], ...]:
+        """Returns the predictions for a game of several boards, given the unsolved ones.
+        By default, those for the first board alone (boards are solved one at a time)."""
+        return self.predict(data, boards[0])
+
+    def get_candidates(
+        self: "Algorithm", data: SolverData, board: dict[str, Tuple[int, ...]]
+    ) -> np.ndarray:
+        """Returns the surviving candidate ids, carried over from the previous turn."""
+        if self.state is None or self.state.data is not data:
+            self.state = GameState(data)
+        if data.metrics is None:
+            return self.state.update(board)
+        start: float = perf_counter()
+        ids: np.ndarray = self.state.update(board)
+        data.metrics.add("filter", perf_counter() - start)
+        data.metrics.set_candidates(len(ids))
+        return ids
+
 
 class Random(Algorithm):
     def predict(
@@ -210,10 +377,9 @@ class Random(Algorithm):
         # Does not use feedback as it is pure random.
 
         WORD_LIST: tuple[str, ...] = data.considered_words
-        guesses: set = set()
 
-        while len(guesses) < 20:
-            guesses.add(random.choice(WORD_LIST))
+        # Sampled rather than collected in a set, whose order varies with the hash seed.
+        guesses: list[str] = random.sample(WORD_LIST, min(20, len(WORD_LIST)))
 
         return tuple([(g, 1 / len(WORD_LIST)) for g in guesses])
 
@@ -223,88 +389,150 @@ class RandomFiltered(Algorithm):
         self: "RandomFiltered", data: SolverData, board: dict[str, Tuple[int, ...]]
     ) -> Tuple[Tuple[str, float], ...]:
         WORD_LIST: tuple[str, ...] = data.considered_words
-        summed_feedback: Dict[str, Dict[str, Set[int] | int]] = {
-            k: {}
-            for k in ("absent", "excluded", "min_counted", "max_counted", "correct")
-        }
-        col_guess: List[str] = [
-            "".join([guess[i] for guess in board]) for i in range(5)
-        ]
-        col_fdbk: List[List[int]] = [
-            [fdbk[i] for fdbk in board.values()] for i in range(5)
-        ]
-        for col, guess, fdbk in zip(range(5), col_guess, col_fdbk):
-            for row, ltr, f_ltr in zip(range(6), guess, fdbk):
-                if f_ltr == 1:
-                    if ltr not in summed_feedback["correct"]:
-                        summed_feedback["correct"][ltr] = set()
-                    summed_feedback["correct"][ltr].add(col)
-                elif f_ltr == 0:
-                    if ltr not in summed_feedback["excluded"]:
-                        summed_feedback["excluded"][ltr] = set()
-                    summed_feedback["excluded"][ltr].add(col)
-                elif (
-                    f_ltr == -1
-                    and ltr not in summed_feedback["correct"]
-                    and ltr not in summed_feedback["excluded"]
-                ):
-                    if ltr not in summed_feedback["absent"]:
-                        summed_feedback["absent"][ltr] = set()
-                    summed_feedback["absent"][ltr].add(col)
-
-        filtered_words: set = set()
-        for word in WORD_LIST:
-            is_v: bool = True
-            for ltr in summed_feedback["absent"]:  # Gray check for absence.
-                if ltr in word:
-                    is_v = False
-                    break
-            if is_v:
-                for ltr in summed_feedback["excluded"]:  # Yellow check for prescence.
-                    if ltr not in word:
-                        is_v = False
-                        break
-            if is_v:
-                for ltr in summed_feedback[
-                    "excluded"
-                ]:  # Yellow check for position exclusion.
-                    if any([word[i] == ltr for i in summed_feedback["excluded"][ltr]]):
-                        is_v = False
-                        break
-            if is_v:
-                for ltr in summed_feedback["correct"]:  # Green check for correctness.
-                    if not all(
-                        [word[i] == ltr for i in summed_feedback["correct"][ltr]]
-                    ):
-                        is_v = False
-                        break
-            if is_v:
-                filtered_words.add(word)
-        return tuple([(g, 1 / len(filtered_words)) for g in filtered_words])
+        filtered_ids: np.ndarray = self.get_candidates(data, board)
+        return tuple([(WORD_LIST[i], 1 / len(filtered_ids)) for i in filtered_ids])
 
 
 class Entropy(Algorithm):
+    @staticmethod
+    def get_precomputed(
+        data: SolverData, board: dict[str, Tuple[int, ...]]
+    ) -> Tuple[Tuple[str, float], ...] | None:
+        """Returns the precomputed first or second guesses for the board, if any."""
+        if not data.openers or data.opener_variant != OpenerCache.get_variant(data):
+            return None
+        if not board:
+            return data.openers
+        if len(board) == 1:
+            guess, fdbk = next(iter(board.items()))
+            if guess == data.openers[0][0] and -2 not in fdbk:
+                return data.second_guesses.get(Pattern.encode(fdbk))
+        return None
+
     def predict(
         self: "Entropy", data: SolverData, board: dict[str, Tuple[int, ...]]
     ) -> Tuple[Tuple[str, float], ...]:
-        auto_instance: Auto = Auto()
-        rand_f_instance: RandomFiltered = RandomFiltered()
-
-        VALID_GUESSES: Tuple[str, ...] = tuple(
-            [g[0] for g in rand_f_instance.predict(data, board)]
-        )
-        guess_entropies: dict[str, float] = {}
-        patterns: Tuple[Tuple[int, ...], ...] = tuple(
-            [tuple(p) for p in product((-1, 0, 1), repeat=5)]
+        # Precomputed first and second guesses (survivors still counted for metrics).
+        precomputed: Tuple[Tuple[str, float], ...] | None = Entropy.get_precomputed(
+            data, board
         )
+        if precomputed is not None:
+            if data.metrics is not None:
+                self.get_candidates(data, board)
+            return precomputed
 
         if 0 < len(board):
-            for guess in VALID_GUESSES:
-                entropy: float = EntropyCalc.get_entropy(
-                    VALID_GUESSES, guess, patterns, auto_instance
+            ids: np.ndarray = self.get_candidates(data, board)
+
+            # Positions seen before, in this game or an earlier one.
+            table: TranspositionTable | None = data.transpositions
+            if table is not None:
+                key: bytes = TranspositionTable.get_key(
+                    ids, OpenerCache.get_variant(data)
                 )
-                guess_entropies[guess] = entropy
+                cached: Tuple[Tuple[str, float], ...] | None = table.get(key)
+                if cached is not None:
+                    return cached
+
+            # Hard mode guesses among the candidates, soft mode from the whole list.
+            guess_ids: np.ndarray = (
+                ids if data.hard_mode else np.arange(len(data.considered_words))
+            )
+            ranked: list[Tuple[int, float]] = EntropyCalc.get_ranked(
+                data.patterns,
+                guess_ids,
+                ids,
+                workers=data.score_workers,
+                weights=data.priors[ids] if data.ranking == "weighted" else None,
+                letters=data.word_index.letters,
+            )
+            guesses: Tuple[Tuple[str, float], ...] = tuple(
+                [(data.considered_words[i], h) for i, h in ranked]
+            )
+            if table is not None:
+                table.put(key, guesses)
+            return guesses
+        elif data.word_length == 5:
+            return tuple([(random.choice(("slate", "crane", "salet")), 1)])
+        else:
+            return tuple([(random.choice(data.considered_words), 1)])
+
+
+class Tree(Algorithm):
+    """Walks a precomputed decision tree, falls back to Entropy off the tree."""
+
+    WIDTH: int = 3
 
-            return tuple([g for g in sorted(guess_entropies.items(), key=lambda t: t[1], reverse=True)[:10]])
+    def __init__(self: "Tree") -> None:
+        super().__init__()
+        self.tree: DecisionTree | None = None
+        self.fallback: Entropy = Entropy()
+
+    def prepare(self: "Tree", data: SolverData) -> None:
+        if self.tree is None:
+            self.tree = DecisionTree.get_tree(data, self.WIDTH)
+
+    def predict(
+        self: "Tree", data: SolverData, board: dict[str, Tuple[int, ...]]
+    ) -> Tuple[Tuple[str, float], ...]:
+        self.prepare(data)
+        node: dict | None = self.tree.walk(board)
+        if node is None:
+            # Only the top guess: Auto.guess picks at random unless the algorithm is Entropy.
+            return self.fallback.predict(data, board)[:1]
+        if data.metrics is not None:
+            self.get_candidates(data, board)
+        return tuple([(node["guess"], 1 / node["size"])])
+
+
+class MultiEntropy(Entropy):
+    """Entropy for several boards at once: guesses are ranked by the information they are
+    expected to give summed over the unsolved boards, plus the chance of solving one. A
+    board down to its last candidate is solved first, as that guess is needed anyway.
+    On a single board it plays as Entropy."""
+
+    def __init__(self: "MultiEntropy") -> None:
+        super().__init__()
+        self.states: dict[int, GameState] = {}
+
+    def get_board_candidates(
+        self: "MultiEntropy", data: SolverData, boards: list[dict[str, Tuple[int, ...]]]
+    ) -> list[np.ndarray]:
+        """Returns the surviving candidate ids of each board, carried over from the
+        previous turn."""
+        start: float = perf_counter()
+        states: dict[int, GameState] = {}
+        candidates: list[np.ndarray] = []
+        for board in boards:
+            state: GameState | None = self.states.get(id(board))
+            if state is None or state.data is not data:
+                state = GameState(data)
+            states[id(board)] = state
+            candidates.append(state.update(board))
+        self.states = states
+        if data.metrics is not None:
+            data.metrics.add("filter", perf_counter() - start)
+            data.metrics.set_candidates(sum(len(ids) for ids in candidates))
+        return candidates
+
+    def predict_boards(
+        self: "MultiEntropy", data: SolverData, boards: list[dict[str, Tuple[int, ...]]]
+    ) -> Tuple[Tuple[str, float], ...]:
+        # Before any feedback all boards are alike, the best opener for one is the best
+        # for all.
+        if len(boards) == 1 or not boards[0]:
+            return self.predict(data, boards[0])
+
+        candidates: list[np.ndarray] = self.get_board_candidates(data, boards)
+        last: list[int] = [int(ids[0]) for ids in candidates if len(ids) == 1]
+        guess_ids: np.ndarray
+        if last:
+            guess_ids = np.unique(last)
+        elif data.hard_mode:
+            guess_ids = np.unique(np.concatenate(candidates))
         else:
-            return tuple([(random.choice(("slate", "crane", "salet")), 1)])
+            guess_ids = np.arange(len(data.considered_words))
+        ranked: list[Tuple[int, float]] = EntropyCalc.get_ranked_boards(
+            data.patterns, guess_ids, candidates, workers=data.score_workers
+        )
+        return tuple([(data.considered_words[i], h) for i, h in ranked])
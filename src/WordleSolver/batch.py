@@ -0,0 +1,223 @@
+import os
+import contextlib
+import random
+import dataclasses
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import Iterator, Tuple
+from WordleSolver.algo import Context, Algorithm
+from WordleSolver.cache import PatternCache, TranspositionTable
+from WordleSolver.data_structures import SolverData, BatchData, GameData
+from WordleSolver.metrics import Metrics
+from WordleSolver.results import ResultWriter
+
+# Per-worker state, set once by _init_worker (or _init_data for the hint server).
+_worker: dict[str, object] = {}
+
+
+def _init_data(data: SolverData, patterns_path: str | None) -> None:
+    """Keeps the solver data in the worker, mapping the shared pattern matrix read-only."""
+    if patterns_path is not None:
+        data.patterns = PatternCache.load(patterns_path)
+    _worker["data"] = data
+
+
+def _init_worker(
+    algorithm: str,
+    data: SolverData,
+    patterns_path: str | None,
+    seed: int,
+    evaluation: str = "Batch",
+) -> None:
+    """Builds the worker's algorithm and evaluation once and maps the shared pattern
+    matrix read-only."""
+    _init_data(data, patterns_path)
+    context: Context = Context()
+    _worker["context"] = context
+    _worker["algorithm"] = context.get_algorithms()[algorithm]()
+    _worker["evaluation"] = context.get_evals()[evaluation]()
+    _worker["seed"] = seed
+
+
+def _play(
+    case: Tuple[int, str],
+) -> Tuple[
+    GameData, list[Tuple[bytes, Tuple[Tuple[str, float], ...]]], Metrics | None
+]:
+    """Plays one answer (space-separated answers for several boards) in a worker, returns
+    its result, the transposition table entries it added and its metrics (if recorded)."""
+    i, answer = case
+    context: Context = _worker["context"]
+    algorithm: Algorithm = _worker["algorithm"]
+    data: SolverData = _worker["data"]
+    table: TranspositionTable | None = data.transpositions
+    hits, misses = (table.hits, table.misses) if table is not None else (0, 0)
+    if data.metrics is not None:
+        data.metrics = Metrics()
+
+    # Seeded per game, so results do not depend on how games are scheduled.
+    random.seed(_worker["seed"] + i)
+    start: float = perf_counter()
+    attempts, boards = context.play_boards(
+        algorithm, _worker["evaluation"], data, answer.split()
+    )
+    seconds: float = perf_counter() - start
+    board: dict[str, Tuple[int, ...]] = Context.merge_boards(boards, data.word_length)
+    game: GameData = GameData(
+        answer,
+        attempts,
+        seconds,
+        case=i,
+        guesses=tuple(board),
+        feedback=tuple(board.values()),
+    )
+    if table is None:
+        return game, [], data.metrics
+    game.table_hits, game.table_misses = table.hits - hits, table.misses - misses
+    return game, table.drain(), data.metrics
+
+
+class Batch:
+    @staticmethod
+    def share(data: SolverData) -> Tuple[SolverData, str | None]:
+        """Returns the data to hand to worker processes and the path of its pattern matrix.
+        Workers re-map a cached matrix (see _init_data) instead of receiving a pickled
+        copy, so it is left out of the data when it has a path."""
+        patterns_path: str | None = getattr(data.patterns, "filename", None)
+        if patterns_path is None:
+            return data, None
+        return dataclasses.replace(data, patterns=None), patterns_path
+
+    @staticmethod
+    def run(
+        algorithm: str,
+        data: SolverData,
+        answers: Tuple[str, ...] | None = None,
+        workers: int | None = None,
+        seed: int = 0,
+        writer: ResultWriter | None = None,
+        evaluation: str = "Batch",
+    ) -> BatchData:
+        """Plays every answer (all considered words by default) once, in order, spread
+        across a process pool, and aggregates the results. With a writer, each game is
+        recorded as it finishes and cases the writer already recorded are skipped.
+
+        With several boards, an answer is the board answers separated by spaces (by
+        default every considered word once, grouped by Batch.get_groups). evaluation
+        names the Context evaluation mode giving feedback, e.g. Adversarial."""
+        if answers is None:
+            answers = (
+                data.considered_words
+                if data.boards == 1
+                else Batch.get_groups(data.considered_words, data.boards, seed)
+            )
+        workers = workers or os.cpu_count() or 1
+        cases: list[Tuple[int, str]] = [
+            (i, answer)
+            for i, answer in enumerate(answers)
+            if writer is None or i not in writer.recorded
+        ]
+
+        shared, patterns_path = Batch.share(data)
+
+        # Built once here so workers load precomputed tables from the cache.
+        Context().get_algorithms()[algorithm]().prepare(data)
+
+        # Games are handed out a window at a time, so memory does not grow with the count.
+        chunksize: int = max(1, min(len(cases) // (workers * 8), 32))
+        window: int = workers * chunksize * 8
+        histogram: np.ndarray = np.zeros(data.allowed_guesses + 1, dtype=np.int64)
+        seconds: float = 0.0
+        table_hits: int = 0
+        table_misses: int = 0
+
+        start: float = perf_counter()
+        with contextlib.ExitStack() as stack:
+            executor: ProcessPoolExecutor | None = None
+            if workers == 1:
+                # In this process, so a profiler sees the games.
+                _init_worker(
+                    algorithm, dataclasses.replace(data), None, seed, evaluation
+                )
+            else:
+                executor = stack.enter_context(
+                    ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=_init_worker,
+                        initargs=(algorithm, shared, patterns_path, seed, evaluation),
+                    )
+                )
+            for w in range(0, len(cases), window):
+                games: Iterator = (
+                    map(_play, cases[w : w + window])
+                    if executor is None
+                    else executor.map(_play, cases[w : w + window], chunksize=chunksize)
+                )
+                for game, added, metrics in games:
+                    histogram[game.shots - 1] += 1
+                    seconds += game.seconds
+                    table_hits += game.table_hits
+                    table_misses += game.table_misses
+                    if writer is not None:
+                        writer.write(game)
+                    # Workers fill their own copies, merged back so later runs reuse them.
+                    if data.transpositions is not None:
+                        for key, ranked in added:
+                            data.transpositions.put(key, ranked)
+                    if data.metrics is not None and metrics is not None:
+                        data.metrics.merge(metrics)
+        wall_time: float = perf_counter() - start
+        if data.transpositions is not None:
+            data.transpositions.drain()
+        if writer is not None:
+            writer.flush()
+
+        games_played: int = int(histogram.sum())
+        shot_sum: int = int(np.dot(histogram, np.arange(1, len(histogram) + 1)))
+        return BatchData(
+            algorithm,
+            games_played,
+            [int(n) for n in histogram],
+            shot_sum / games_played if games_played else 0.0,
+            int(histogram[-1]) / games_played if games_played else 0.0,
+            seconds / games_played if games_played else 0.0,
+            wall_time,
+            table_hits,
+            table_misses,
+        )
+
+    @staticmethod
+    def get_groups(words: Tuple[str, ...], boards: int, seed: int = 0) -> Tuple[str, ...]:
+        """Returns the words shuffled (seeded) into games of `boards` distinct answers, as
+        space-separated answers. Every word is an answer once, except that leftover words
+        (fewer than `boards`) are topped up with words from the first games."""
+        shuffled: list[str] = random.Random(seed).sample(words, len(words))
+        leftover: int = len(shuffled) % boards
+        if leftover and boards <= len(shuffled):
+            shuffled += shuffled[: boards - leftover]
+        return tuple(
+            [
+                " ".join(shuffled[i : i + boards])
+                for i in range(0, len(shuffled) - boards + 1, boards)
+            ]
+        )
+
+    @staticmethod
+    def display(data: BatchData) -> None:
+        """Prints a summary of a batch run."""
+        print(f"Algorithm: {data.algo}")
+        print(f"Games: {data.games}")
+        print(f"Average n-shot: {data.mean:.3f}")
+        print(f"Fail Rate: {data.fail_rate * 100:.2f}%")
+        for shot, count in enumerate(data.histogram, 1):
+            label: str = f"{shot}" if shot < len(data.histogram) else "UNSOLVED"
+            print(f"{label:>8} | {count}")
+        print(f"Mean game time: {data.game_time * 1000:.2f} ms")
+        print(f"Wall time: {data.wall_time:.2f} s")
+        lookups: int = data.table_hits + data.table_misses
+        if lookups:
+            print(
+                f"Transposition table: {data.table_hits} hits, {data.table_misses} "
+                f"misses ({data.table_hits / lookups * 100:.1f}% hit rate)"
+            )
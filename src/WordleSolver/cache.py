@@ -0,0 +1,293 @@
+import os
+import json
+import struct
+import hashlib
+import contextlib
+import numpy as np
+from collections import OrderedDict
+from typing import IO, Iterator, Tuple
+from WordleSolver.data_structures import SolverData
+from WordleSolver.patterns import Pattern
+from WordleSolver.utils import EntropyCalc
+
+
+@contextlib.contextmanager
+def atomic_write(path: str, mode: str = "w") -> Iterator[IO]:
+    """Opens a temporary file next to path, moved over path once written, so readers
+    never see a partial file. The temporary file is removed if writing fails."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path: str = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, mode) as FILE:
+            yield FILE
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
+
+class PatternCache:
+    """On-disk cache of the pattern matrix, memory-mapped on load so solver processes
+    share the same physical pages.
+
+    File layout: a fixed-size header (magic, format version, rows, columns, key digest,
+    bytes per pattern id) followed by the raw matrix in row-major order."""
+
+    MAGIC: bytes = b"WSPM"
+    VERSION: int = 2
+    HEADER: struct.Struct = struct.Struct("<4sIQQ32sI")
+    HEADER_SIZE: int = 64
+
+    @staticmethod
+    def get_key(words: Tuple[str, ...], threshold: float) -> bytes:
+        """Returns the cache key digest for a word list and frequency threshold."""
+        hasher = hashlib.sha256()
+        hasher.update(repr(threshold).encode("ascii"))
+        hasher.update(b"\0")
+        hasher.update("\n".join(words).encode("ascii"))
+        return hasher.digest()
+
+    @staticmethod
+    def get_path(cache_path: str, key: bytes) -> str:
+        """Returns the file path of the cache entry for a key."""
+        return os.path.join(
+            cache_path, f"patterns-v{PatternCache.VERSION}-{key.hex()[:16]}.bin"
+        )
+
+    @staticmethod
+    def load(path: str, key: bytes | None = None) -> np.memmap | None:
+        """Memory-maps a cached matrix, returns None if missing, stale or corrupt."""
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as FILE:
+            header: bytes = FILE.read(PatternCache.HEADER.size)
+        if len(header) != PatternCache.HEADER.size:
+            return None
+        magic, version, rows, cols, digest, itemsize = PatternCache.HEADER.unpack(
+            header
+        )
+        if (
+            magic != PatternCache.MAGIC
+            or version != PatternCache.VERSION
+            or (key is not None and digest != key)
+            or itemsize not in (1, 2, 4)
+            or os.path.getsize(path)
+            != PatternCache.HEADER_SIZE + rows * cols * itemsize
+        ):
+            return None
+        return np.memmap(
+            path,
+            dtype=np.dtype(f"<u{itemsize}"),
+            mode="r",
+            offset=PatternCache.HEADER_SIZE,
+            shape=(rows, cols),
+        )
+
+    @staticmethod
+    def save(path: str, key: bytes, matrix: np.ndarray) -> None:
+        """Writes a matrix to the cache, replacing any existing entry atomically."""
+        header: bytes = PatternCache.HEADER.pack(
+            PatternCache.MAGIC,
+            PatternCache.VERSION,
+            *matrix.shape,
+            key,
+            matrix.dtype.itemsize,
+        )
+        with atomic_write(path, "wb") as FILE:
+            FILE.write(header.ljust(PatternCache.HEADER_SIZE, b"\0"))
+            FILE.write(
+                np.ascontiguousarray(matrix, dtype=matrix.dtype.newbyteorder("<"))
+                .tobytes()
+            )
+
+    @staticmethod
+    def get_matrix(
+        cache_path: str, words: Tuple[str, ...], threshold: float
+    ) -> np.ndarray:
+        """Returns the pattern matrix for a word list, loading it from the cache or building
+        and caching it if missing or stale."""
+        key: bytes = PatternCache.get_key(words, threshold)
+        path: str = PatternCache.get_path(cache_path, key)
+        cached: np.memmap | None = PatternCache.load(path, key)
+        if cached is not None and cached.shape == (len(words), len(words)):
+            return cached
+
+        words_array: np.ndarray = Pattern.to_array(words)
+        matrix: np.ndarray = Pattern.get_matrix(words_array, words_array)
+        try:
+            PatternCache.save(path, key, matrix)
+        except OSError:
+            # Read-only or full cache location, keep the in-memory matrix.
+            return matrix
+        cached = PatternCache.load(path, key)
+        return cached if cached is not None else matrix
+
+
+class OpenerCache:
+    """On-disk table of the ranked opening guesses per word list, and of the ranked second
+    guesses after the best opener for each of its feedback patterns. Entries are kept per
+    variant, as hard/soft mode and the ranking change both."""
+
+    VERSION: int = 3
+    RANKED: int = 10
+
+    @staticmethod
+    def get_path(cache_path: str) -> str:
+        """Returns the file path of the opener table."""
+        return os.path.join(cache_path, f"openers-v{OpenerCache.VERSION}.json")
+
+    @staticmethod
+    def get_variant(data: SolverData) -> str:
+        """Returns the name of the variant Entropy ranks guesses with (e.g. hard-entropy)."""
+        return f"{'hard' if data.hard_mode else 'soft'}-{data.ranking}"
+
+    @staticmethod
+    def build(data: SolverData) -> dict:
+        """Scores every opener, then every second guess (hard: among the candidates, soft:
+        from the whole list) for the candidates left by each feedback pattern of the best
+        opener."""
+        words: Tuple[str, ...] = data.considered_words
+        weighted: bool = data.ranking == "weighted"
+        ids: np.ndarray = np.arange(len(words))
+        letters: np.ndarray = data.word_index.letters
+        openers: list[Tuple[int, float]] = EntropyCalc.get_ranked(
+            data.patterns,
+            ids,
+            ids,
+            OpenerCache.RANKED,
+            weights=data.priors if weighted else None,
+            letters=letters,
+        )
+        row: np.ndarray = np.asarray(data.patterns[openers[0][0]])
+
+        seconds: dict[str, list[list[str | float]]] = {}
+        for code in np.unique(row):
+            candidates: np.ndarray = np.flatnonzero(row == code)
+            seconds[str(int(code))] = [
+                [words[i], h]
+                for i, h in EntropyCalc.get_ranked(
+                    data.patterns,
+                    candidates if data.hard_mode else ids,
+                    candidates,
+                    OpenerCache.RANKED,
+                    weights=data.priors[candidates] if weighted else None,
+                    letters=letters,
+                )
+            ]
+        return {"opener": [[words[i], h] for i, h in openers], "second": seconds}
+
+    @staticmethod
+    def get_openers(
+        cache_path: str, data: SolverData, threshold: float
+    ) -> Tuple[Tuple[Tuple[str, float], ...], dict[int, Tuple[Tuple[str, float], ...]]]:
+        """Returns the ranked openers and the ranked second guesses per feedback pattern of
+        the best opener for the active variant, building and storing them if not yet in
+        the table."""
+        key: str = PatternCache.get_key(data.considered_words, threshold).hex()
+        variant: str = OpenerCache.get_variant(data)
+        path: str = OpenerCache.get_path(cache_path)
+        table: dict = {}
+        if os.path.exists(path):
+            try:
+                with open(path, "r") as FILE:
+                    table = json.load(FILE)
+            except (OSError, ValueError):
+                table = {}
+
+        if variant not in table.get(key, {}):
+            table.setdefault(key, {})[variant] = OpenerCache.build(data)
+            try:
+                with atomic_write(path) as FILE:
+                    json.dump(table, FILE)
+            except OSError:
+                pass
+
+        entry: dict = table[key][variant]
+        return (
+            tuple([(w, h) for w, h in entry["opener"]]),
+            {
+                int(code): tuple([(w, h) for w, h in ranked])
+                for code, ranked in entry["second"].items()
+            },
+        )
+
+
+class TranspositionTable:
+    """LRU-bounded map from a candidate set (and Entropy variant) to its ranked guesses, so
+    positions reached again, in the same or a later game, are not re-scored."""
+
+    VERSION: int = 1
+
+    def __init__(self: "TranspositionTable", capacity: int = 100_000) -> None:
+        self.capacity: int = capacity
+        self.entries: OrderedDict[bytes, Tuple[Tuple[str, float], ...]] = OrderedDict()
+        self.added: list[Tuple[bytes, Tuple[Tuple[str, float], ...]]] = []
+        self.hits: int = 0
+        self.misses: int = 0
+
+    @staticmethod
+    def get_key(candidates: np.ndarray, variant: str) -> bytes:
+        """Returns the fingerprint of a candidate set for a variant."""
+        hasher = hashlib.blake2b(variant.encode("ascii"), digest_size=16)
+        hasher.update(np.ascontiguousarray(candidates, dtype=np.int64).tobytes())
+        return hasher.digest()
+
+    @staticmethod
+    def get_path(cache_path: str, cache_key: str) -> str:
+        """Returns the file path of the persisted table for a word list."""
+        return os.path.join(
+            cache_path,
+            f"transpositions-v{TranspositionTable.VERSION}-{cache_key[:16]}.json",
+        )
+
+    def get(
+        self: "TranspositionTable", key: bytes
+    ) -> Tuple[Tuple[str, float], ...] | None:
+        """Returns the ranked guesses for a key (marking it recently used), or None."""
+        ranked: Tuple[Tuple[str, float], ...] | None = self.entries.get(key)
+        if ranked is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return ranked
+
+    def put(
+        self: "TranspositionTable", key: bytes, ranked: Tuple[Tuple[str, float], ...]
+    ) -> None:
+        """Stores ranked guesses, evicting the least recently used entry when full."""
+        if self.capacity <= 0:
+            return
+        self.entries[key] = ranked
+        self.entries.move_to_end(key)
+        self.added.append((key, ranked))
+        while self.capacity < len(self.entries):
+            self.entries.popitem(last=False)
+
+    def drain(
+        self: "TranspositionTable",
+    ) -> list[Tuple[bytes, Tuple[Tuple[str, float], ...]]]:
+        """Returns and forgets the entries added since the last drain."""
+        added, self.added = self.added, []
+        return added
+
+    def load(self: "TranspositionTable", path: str) -> None:
+        """Adds the entries of a persisted table, ignoring a missing or unreadable file."""
+        try:
+            with open(path, "r") as FILE:
+                stored: dict[str, list[list[str | float]]] = json.load(FILE)
+        except (OSError, ValueError):
+            return
+        for key, ranked in stored.items():
+            self.put(bytes.fromhex(key), tuple([(w, h) for w, h in ranked]))
+        self.added = []
+
+    def save(self: "TranspositionTable", path: str) -> None:
+        """Persists the table, replacing any existing file atomically."""
+        with atomic_write(path) as FILE:
+            json.dump(
+                {key.hex(): ranked for key, ranked in self.entries.items()},
+                FILE,
+                separators=(",", ":"),
+            )
@@ -0,0 +1,293 @@
+import os
+import json
+import asyncio
+import random
+import argparse
+import dataclasses
+from typing import Tuple, Sequence
+from WordleSolver.algo import Context, Adversarial
+from WordleSolver.batch import Batch
+from WordleSolver.cache import TranspositionTable
+from WordleSolver.data_structures import BatchData, SolverData
+from WordleSolver.metrics import Metrics
+from WordleSolver.patterns import Pattern
+from WordleSolver.results import ResultWriter
+from WordleSolver.server import Server
+from WordleSolver.solver import Solver
+
+
+class CLI:
+    @staticmethod
+    def get_algorithms(context: Context) -> dict[str, str]:
+        """Maps command-line algorithm names (e.g. random-filtered) to registered names."""
+        return {a.lower().replace(" ", "-"): a for a in context.get_algorithms()}
+
+    @staticmethod
+    def get_parser(context: Context) -> argparse.ArgumentParser:
+        parser: argparse.ArgumentParser = argparse.ArgumentParser(
+            prog="wordle-solver",
+            description="Runs a Wordle solving algorithm without interactive prompts.",
+        )
+        parser.add_argument(
+            "-a",
+            "--algorithm",
+            choices=tuple(CLI.get_algorithms(context)),
+            default="entropy",
+        )
+        parser.add_argument(
+            "-m",
+            "--mode",
+            choices=("batch", "pre-defined", "adversarial", "serve"),
+            default="batch",
+            help="batch: every answer once, in order. "
+            "pre-defined: --cases answers drawn at random (seeded) with replacement. "
+            "adversarial: --cases games (default 1) where feedback keeps the most "
+            "candidates, a greedy worst case. "
+            "serve: answer hint requests (see --listen).",
+        )
+        parser.add_argument(
+            "-t",
+            "--threshold",
+            type=float,
+            default=5e-7,
+            help="Word frequency threshold (default: 5e-7, 0 for all words).",
+        )
+        parser.add_argument(
+            "-n",
+            "--cases",
+            type=int,
+            default=None,
+            help="Number of games (default: all answers in batch, 500 in pre-defined).",
+        )
+        parser.add_argument("-s", "--seed", type=int, default=0)
+        parser.add_argument(
+            "-l",
+            "--length",
+            type=int,
+            default=5,
+            help=f"Word length, 1 to {Pattern.MAX_LENGTH} (default: 5).",
+        )
+        parser.add_argument(
+            "-b",
+            "--boards",
+            type=int,
+            default=1,
+            help="Boards played at once, e.g. 4 for Quordle, 8 for Octordle (default: 1).",
+        )
+        parser.add_argument(
+            "-g",
+            "--guesses",
+            type=int,
+            default=None,
+            help=f"Guesses allowed per game (default: {Context.ALLOWED_GUESSES}, plus one "
+            "per extra board).",
+        )
+        parser.add_argument(
+            "-w",
+            "--workers",
+            type=int,
+            default=None,
+            help="Worker processes (default: CPU count).",
+        )
+        parser.add_argument(
+            "--soft",
+            action="store_true",
+            help="Let Entropy guess any considered word, not only remaining candidates.",
+        )
+        parser.add_argument(
+            "--ranking",
+            choices=("entropy", "weighted"),
+            default="entropy",
+            help="weighted: weight patterns by word-frequency priors and favor likely answers.",
+        )
+        parser.add_argument(
+            "--score-workers",
+            type=int,
+            default=1,
+            help="Threads each game uses to score guesses (default: 1).",
+        )
+        parser.add_argument(
+            "--table-size",
+            type=int,
+            default=100_000,
+            help="Positions the transposition table keeps (default: 100000, 0 disables).",
+        )
+        parser.add_argument(
+            "--persist-table",
+            action="store_true",
+            help="Load the transposition table from the cache and save it after the run.",
+        )
+        parser.add_argument(
+            "--results",
+            metavar="PATH",
+            default=None,
+            help="Append one record per game to PATH (.csv or .jsonl) as games finish. "
+            "Games already in PATH are skipped, so an interrupted run resumes.",
+        )
+        parser.add_argument(
+            "--metrics",
+            metavar="PATH",
+            default=None,
+            help="Record per-turn timings and write them to PATH (.csv or .json).",
+        )
+        parser.add_argument(
+            "--profile",
+            metavar="PATH",
+            default=None,
+            help="Run the games in this process under cProfile and write the stats to PATH.",
+        )
+        parser.add_argument(
+            "--listen",
+            metavar="HOST:PORT",
+            default=None,
+            help="serve: HTTP address (e.g. 127.0.0.1:8080), "
+            "default newline-delimited JSON on stdin/stdout.",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=5.0,
+            help="serve: seconds before a request is answered with an error.",
+        )
+        parser.add_argument(
+            "--queue-size",
+            type=int,
+            default=256,
+            help="serve: requests waiting at most, more are rejected as busy.",
+        )
+        parser.add_argument("-f", "--format", choices=("json", "text"), default="json")
+        return parser
+
+    @staticmethod
+    def get_answers(
+        words: Tuple[str, ...], mode: str, cases: int | None, seed: int, boards: int = 1
+    ) -> Tuple[str, ...]:
+        """Returns the answers to play for a mode, space-separated per game for several
+        boards. Adversarial games have no answer, only a placeholder."""
+        if mode == "adversarial":
+            return (Adversarial.get_placeholder(len(words[0])),) * (
+                1 if cases is None else cases
+            )
+        if mode == "pre-defined":
+            rng: random.Random = random.Random(seed)
+            count: int = 500 if cases is None else cases
+            if 1 < boards:
+                return tuple([" ".join(rng.sample(words, boards)) for _ in range(count)])
+            return tuple([rng.choice(words) for _ in range(count)])
+        if 1 < boards:
+            words = Batch.get_groups(words, boards, seed)
+        return words if cases is None else words[:cases]
+
+    @staticmethod
+    def serve(data: SolverData, args: argparse.Namespace) -> int:
+        """Runs the hint server until interrupted (or end of input on stdin)."""
+        data.transpositions = (
+            TranspositionTable(args.table_size) if 0 < args.table_size else None
+        )
+        server: Server = Server(
+            data, args.workers or os.cpu_count() or 1, args.queue_size, args.timeout
+        )
+        try:
+            if args.listen:
+                host, _, port = args.listen.rpartition(":")
+                asyncio.run(server.serve_http(host or "127.0.0.1", int(port)))
+            else:
+                asyncio.run(server.serve_stdio())
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    @staticmethod
+    def main(argv: Sequence[str] | None = None) -> int:
+        """Entry point for non-interactive execution."""
+        context: Context = Context()
+        parser: argparse.ArgumentParser = CLI.get_parser(context)
+        args: argparse.Namespace = parser.parse_args(argv)
+        if not 1 <= args.length <= Pattern.MAX_LENGTH:
+            parser.error(
+                f"--length must be between 1 and {Pattern.MAX_LENGTH}, not {args.length}."
+            )
+        if args.boards < 1:
+            parser.error(f"--boards must be at least 1, not {args.boards}.")
+        if args.mode == "adversarial" and args.boards != 1:
+            parser.error("adversarial mode plays one board, --boards must be 1.")
+        for flag in ("guesses", "cases", "workers"):
+            value: int | None = getattr(args, flag)
+            if value is not None and value < 1:
+                parser.error(f"--{flag} must be at least 1, not {value}.")
+        if args.score_workers < 1:
+            parser.error(f"--score-workers must be at least 1, not {args.score_workers}.")
+        if args.table_size < 0:
+            parser.error(f"--table-size must be at least 0, not {args.table_size}.")
+        if args.queue_size < 1:
+            parser.error(f"--queue-size must be at least 1, not {args.queue_size}.")
+        if not 0 < args.timeout:
+            parser.error(f"--timeout must be positive, not {args.timeout}.")
+
+        guesses: int = (
+            Context.ALLOWED_GUESSES + args.boards - 1
+            if args.guesses is None
+            else args.guesses
+        )
+        try:
+            solver: Solver = Solver(
+                context,
+                args.threshold,
+                args.length,
+                guesses,
+                hard_mode=not args.soft,
+                ranking=args.ranking,
+            )
+        except ValueError as error:
+            parser.error(f"{error} Try a lower --threshold or another --length.")
+        if len(solver.solver_data.considered_words) < args.boards:
+            parser.error(
+                f"--boards {args.boards} needs as many words, only "
+                f"{len(solver.solver_data.considered_words)} are above the threshold."
+            )
+        solver.solver_data.boards = args.boards
+        solver.solver_data.score_workers = args.score_workers
+        if args.mode == "serve":
+            return CLI.serve(solver.solver_data, args)
+        table: TranspositionTable | None = (
+            TranspositionTable(args.table_size) if 0 < args.table_size else None
+        )
+        if table is not None and args.persist_table:
+            table.load(solver.get_table_path())
+        solver.solver_data.transpositions = table
+        answers: Tuple[str, ...] = CLI.get_answers(
+            solver.solver_data.considered_words,
+            args.mode,
+            args.cases,
+            args.seed,
+            args.boards,
+        )
+        if args.metrics:
+            solver.solver_data.metrics = Metrics()
+        run_args: tuple = (
+            CLI.get_algorithms(context)[args.algorithm],
+            solver.solver_data,
+            answers,
+            1 if args.profile else args.workers,
+            args.seed,
+            ResultWriter(args.results) if args.results else None,
+            "Adversarial" if args.mode == "adversarial" else "Batch",
+        )
+        result: BatchData = (
+            Metrics.profile(args.profile, Batch.run, *run_args)
+            if args.profile
+            else Batch.run(*run_args)
+        )
+        if args.metrics:
+            solver.solver_data.metrics.save(args.metrics)
+        if table is not None and args.persist_table:
+            try:
+                table.save(solver.get_table_path())
+            except OSError:
+                pass
+
+        if args.format == "json":
+            print(json.dumps(dataclasses.asdict(result)))
+        else:
+            Batch.display(result)
+        return 0
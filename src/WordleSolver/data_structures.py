@@ -1,10 +1,17 @@
-from dataclasses import dataclass
-from typing import Tuple
+from dataclasses import dataclass, field
+from typing import Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from WordleSolver.index import WordIndex
+    from WordleSolver.cache import TranspositionTable
+    from WordleSolver.metrics import Metrics
 
 @dataclass
 class InitData:
     exec_path: str
     data_path: str
+    cache_path: str
     
 @dataclass
 class SolverData:
@@ -12,6 +19,25 @@ class SolverData:
     word_frequencies: dict[str, float]
     update_interval: float
     case_size: int
+    word_length: int = 5
+    allowed_guesses: int = 6
+    boards: int = 1  # Answers guessed at once, e.g. 4 for Quordle, 8 for Octordle.
+    patterns: "np.ndarray | None" = None  # (guess, answer) pattern ids over considered_words.
+    word_index: "WordIndex | None" = None
+    openers: Tuple[Tuple[str, float], ...] = ()  # Ranked first guesses.
+    second_guesses: dict[int, Tuple[Tuple[str, float], ...]] = field(
+        default_factory=dict
+    )  # Ranked second guesses after openers[0], per feedback pattern id.
+    opener_variant: str = ""  # Variant the openers were ranked for, e.g. hard-entropy.
+    hard_mode: bool = True  # Entropy only guesses words that can still be the answer.
+    score_workers: int = 1  # Threads used to score guesses each turn.
+    cache_path: str = ""  # Directory for precomputed tables, "" to disable.
+    cache_key: str = ""  # Hex digest identifying the word list and threshold.
+    transpositions: "TranspositionTable | None" = None  # Candidate set -> ranked guesses.
+    metrics: "Metrics | None" = None  # Per-turn timings, recorded only when set.
+    render_every: int = 0  # Redraw Pre-defined runs every n cases, 0 = by update_interval.
+    priors: "np.ndarray | None" = None  # Probability of each word being the answer.
+    ranking: str = "entropy"  # "entropy" or frequency-"weighted".
 
 @dataclass
 class InputData:
@@ -21,8 +47,45 @@ class InputData:
     
 @dataclass
 class RuntimeData:
-    shots: list[int]
     successes: int
     failures: int
     case: int
-    algo: str
\ No newline at end of file
+    algo: str
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * 7
+    )  # Games solved in 1..allowed_guesses shots, last bin unsolved.
+    shot_sum: int = 0
+
+@dataclass
+class BatchData:
+    algo: str
+    games: int
+    histogram: list[int]  # Games solved in 1..allowed_guesses shots, last bin unsolved.
+    mean: float
+    fail_rate: float
+    game_time: float  # Mean seconds per game.
+    wall_time: float
+    table_hits: int = 0
+    table_misses: int = 0
+
+@dataclass
+class GameData:
+    answer: str
+    shots: int
+    seconds: float
+    table_hits: int = 0
+    table_misses: int = 0
+    case: int = 0
+    guesses: Tuple[str, ...] = ()
+    feedback: Tuple[Tuple[int, ...], ...] = ()
+
+@dataclass
+class TurnData:
+    answer: str
+    turn: int
+    candidates: int | None = None  # Survivors after filtering, None if not filtered.
+    predict: float = 0.0  # Seconds, excluding filter.
+    evaluate: float = 0.0
+    filter: float = 0.0
+    display: float = 0.0
+
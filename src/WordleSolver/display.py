@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Tuple
 from WordleSolver.data_structures import RuntimeData
-import matplotlib.pyplot as plt
 import numpy as np
-from collections import Counter
+from time import perf_counter
 import os
 
 
@@ -32,19 +31,64 @@ class Console(Display):  # TODO
         print(f"Active algorithm: {data.algo}")
         print("\nBoard state: \n")
         for guess in board:
-            [print(f"{guess[i].upper()} ", end="") for i in range(5)]
+            [print(f"{guess[i].upper()} ", end="") for i in range(len(guess))]
             print()
         input("\nPress Enter to continue...")
         print("\n")
 
 
+class RenderScheduler:
+    """Decides when a Pre-defined run redraws: every `every` cases if set, otherwise at most
+    once per `interval` seconds. The first and last cases are always drawn."""
+
+    def __init__(self: "RenderScheduler", interval: float, every: int = 0) -> None:
+        self.interval: float = interval
+        self.every: int = every
+        self._last: float = float("-inf")
+
+    def is_due(self: "RenderScheduler", case: int, total: int) -> bool:
+        now: float = perf_counter()
+        if self.every:
+            due: bool = case % self.every == 0
+        else:
+            due = self.interval <= now - self._last
+        if due or case in (1, total):
+            self._last = now
+            return True
+        return False
+
+
 class MPL(Display):
     """For Pre-defined data, multiple attempts."""
 
-    def __init__(self: "Display") -> None:
+    def __init__(self: "Display", allowed_guesses: int = 6) -> None:
+        # Imported here so that only graphical runs pay for the plotting stack.
+        import matplotlib.pyplot as plt
+
+        self.plt = plt
         plt.ion()
         plt.rcParams["font.family"] = "Cascadia Code"
         plt.style.use("dark_background")
+        self.fig, self.ax = plt.subplots()
+
+        # Artists are created once and updated in place on every redraw.
+        self.line = self.ax.plot(
+            [], [], color="white", linewidth=1, marker="o", linestyle="-"
+        )[0]
+        self.stems = self.ax.vlines(
+            [], [], [], color="white", linestyle="--", linewidth=1, alpha=0.5
+        )
+        self.texts = [self.ax.text(1.25, 0, "") for _ in range(5)]
+
+        bins: list[int] = list(range(1, allowed_guesses + 3))
+        self.ax.set_xticks(bins[:-1])
+        labels: list[str] = [f"{v}" for v in range(1, allowed_guesses + 1)]
+        labels.append("UNSOLVED")
+        self.ax.set_xticklabels(labels)
+        self.ax.set_xlim(0.5, allowed_guesses + 1.5)
+        self.ax.set_xlabel("n-Shots")
+        self.ax.set_ylabel("Frequency")
+        plt.show(block=False)
 
     def display(
         self: "Display",
@@ -55,58 +99,37 @@ class MPL(Display):
 
         # Data.
         success_rate: float = (data.successes / data.case) * 100
-        bins: list[int] = list(range(1, 9))
-        plt.cla()
-        shot_count: Counter = Counter(data.shots)
-        sorted_shots = sorted(shot_count.keys())
-        freqs = [shot_count[shot] for shot in sorted_shots]
-        max_freq: int = np.max(freqs)
+        average: float = data.shot_sum / data.case
+        shots: np.ndarray = np.arange(1, len(data.histogram) + 1)
+        freqs: np.ndarray = np.array(data.histogram)
+        sorted_shots: np.ndarray = shots[freqs > 0]
+        freqs = freqs[freqs > 0]
+        max_freq: int = int(np.max(freqs))
 
         # Main plot.
-        if data.shots:
-            plt.plot(
-                sorted_shots,
-                freqs,
-                color="white",
-                linewidth=1,
-                marker="o",
-                linestyle="-",
-            )
-            for x, y in zip(sorted_shots, freqs):
-                plt.plot(
-                    [x, x],
-                    [0, y],
-                    color="white",
-                    linestyle="--",
-                    linewidth=1,
-                    alpha=0.5,
-                )
-        plt.gca().set_xticks(bins[:-1])
-        labels: list[str] = [f"{v}" for v in range(1, 7)]
-        labels.append("UNSOLVED")
-        plt.gca().set_xticklabels(labels)
-        plt.title(f"Wordle n-Shots ({data.algo})")
-        plt.xlabel("n-Shots")
-        plt.ylabel("Frequency")
-
-        x_align: float = 1.25
-        plt.text(x_align, max_freq * 0.97, f"Case no.: {data.case}")
-        plt.text(x_align, max_freq * 0.92, f"Success Rate: {success_rate:.2f}%")
-        plt.text(
-            x_align,
-            max_freq * 0.87,
-            f"Average n-shot: {f"{np.average(data.shots):.2f}" if np.average(data.shots) < 7 else "DID NOT SOLVE"}",
+        self.line.set_data(sorted_shots, freqs)
+        self.stems.set_segments([[(x, 0), (x, y)] for x, y in zip(sorted_shots, freqs)])
+        self.ax.set_ylim(0, max_freq * 1.05)
+        self.ax.set_title(f"Wordle n-Shots ({data.algo})")
+
+        lines: Tuple[str, ...] = (
+            f"Case no.: {data.case}",
+            f"Success Rate: {success_rate:.2f}%",
+            f"Average n-shot: {f"{average:.2f}" if average < len(data.histogram) else "DID NOT SOLVE"}",
+            f"Successful Attempts: {data.successes}",
+            f"Failed Attempts: {data.failures}",
         )
-        plt.text(x_align, max_freq * 0.82, f"Successful Attempts: {data.successes}")
-        plt.text(x_align, max_freq * 0.77, f"Failed Attempts: {data.failures}")
-        plt.show(block=False)
-        plt.pause(0.02)
+        for i, (text, line) in enumerate(zip(self.texts, lines)):
+            text.set_text(line)
+            text.set_y(max_freq * (0.97 - 0.05 * i))
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
 
         # Console output.
         os.system("cls")
         print(f"Algorithm: {data.algo}")
         print(
-            f"Average n-shot: {f"{np.average(data.shots):.2f}" if np.average(data.shots) < 7 else "FAILED"}"
+            f"Average n-shot: {f"{average:.2f}" if average < len(data.histogram) else "FAILED"}"
         )
         print(f"Success Rate: {success_rate:.2f}%")
         print(f"Successful Attempts: {data.successes}")
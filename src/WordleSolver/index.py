@@ -0,0 +1,14 @@
+import numpy as np
+from typing import Tuple
+from WordleSolver.patterns import Pattern
+
+
+class WordIndex:
+    """Word list lookups: the id of each word and the words as an (n, length) array of
+    letter codes."""
+
+    def __init__(self: "WordIndex", words: Tuple[str, ...]) -> None:
+        self.words: Tuple[str, ...] = words
+        self.ids: dict[str, int] = {w: i for i, w in enumerate(words)}
+        self.length: int = len(words[0]) if words else 0
+        self.letters: np.ndarray = Pattern.to_array(words)
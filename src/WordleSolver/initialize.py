@@ -1,23 +1,90 @@
 import os
-import wordfreq
+import struct
+import hashlib
+import numpy as np
 from typing import Tuple
+from WordleSolver.cache import atomic_write
 from WordleSolver.data_structures import InitData
 
 
 
 class WordData:
+    # Frequency table: header (magic, format version, word count, word list digest)
+    # followed by one little-endian float64 per word.
+    FREQ_MAGIC: bytes = b"WSFQ"
+    FREQ_VERSION: int = 1
+    FREQ_HEADER: struct.Struct = struct.Struct("<4sII32s")
+
+    # Word lists per length, from one scan of each words.txt.
+    _lengths: dict[str, dict[int, Tuple[str, ...]]] = {}
+
     @staticmethod
-    def get_words(data: InitData) -> Tuple[str, ...]:
-        """Gets the list of all 5-letter words in the dictionary."""
-        WORD_LENGTH: int = 5
+    def get_words(data: InitData, length: int = 5) -> Tuple[str, ...]:
+        """Gets the list of all words of a length (5 by default) in the dictionary."""
         TXT_PATH: str = os.path.join(data.data_path, "words.txt")
-        if not os.path.exists(TXT_PATH):
-            raise FileNotFoundError(f"Text file cannot be found at {TXT_PATH}")
-        with open(TXT_PATH, "r") as FILE:
-            return tuple([w for w in FILE.read().split("\n") if len(w) == WORD_LENGTH])
+        if TXT_PATH not in WordData._lengths:
+            if not os.path.exists(TXT_PATH):
+                raise FileNotFoundError(f"Text file cannot be found at {TXT_PATH}")
+            lengths: dict[int, list[str]] = {}
+            with open(TXT_PATH, "r") as FILE:
+                for w in FILE.read().split("\n"):
+                    if w:
+                        lengths.setdefault(len(w), []).append(w)
+            WordData._lengths[TXT_PATH] = {n: tuple(ws) for n, ws in lengths.items()}
+        return WordData._lengths[TXT_PATH].get(length, ())
 
     @staticmethod
-    def get_freqs(words: Tuple[str, ...]) -> dict[str, float]:
-        """Returns a dictionary for a given set of words as keys to their frequency values."""
-        return {word: wordfreq.word_frequency(word, "en") for word in words}
+    def get_freqs(data: InitData, words: Tuple[str, ...]) -> dict[str, float]:
+        """Returns a dictionary for a given set of words as keys to their frequency values.
+        Read from the table shipped next to words.txt or from the cache, wordfreq is only
+        imported to rebuild a missing or stale table."""
+        digest: bytes = hashlib.sha256("\n".join(words).encode("ascii")).digest()
+        name: str = f"freqs-{len(words[0]) if words else 0}.bin"
+        for directory in (data.data_path, data.cache_path):
+            freqs: np.ndarray | None = WordData._load_freqs(
+                os.path.join(directory, name), digest, len(words)
+            )
+            if freqs is not None:
+                return dict(zip(words, freqs.tolist()))
+
+        import wordfreq
+
+        freqs = np.array([wordfreq.word_frequency(w, "en") for w in words])
+        try:
+            WordData._save_freqs(os.path.join(data.cache_path, name), digest, freqs)
+        except OSError:
+            pass
+        return dict(zip(words, freqs.tolist()))
 
+    @staticmethod
+    def _load_freqs(path: str, digest: bytes, count: int) -> np.ndarray | None:
+        """Helper method to read a frequency table, returns None if missing or stale."""
+        if not os.path.exists(path):
+            return None
+        with open(path, "rb") as FILE:
+            header: bytes = FILE.read(WordData.FREQ_HEADER.size)
+            if len(header) != WordData.FREQ_HEADER.size:
+                return None
+            magic, version, table_count, table_digest = WordData.FREQ_HEADER.unpack(
+                header
+            )
+            if (
+                magic != WordData.FREQ_MAGIC
+                or version != WordData.FREQ_VERSION
+                or table_count != count
+                or table_digest != digest
+            ):
+                return None
+            freqs: np.ndarray = np.frombuffer(FILE.read(), dtype="<f8")
+        return freqs if len(freqs) == count else None
+
+    @staticmethod
+    def _save_freqs(path: str, digest: bytes, freqs: np.ndarray) -> None:
+        """Helper method to write a frequency table atomically."""
+        with atomic_write(path, "wb") as FILE:
+            FILE.write(
+                WordData.FREQ_HEADER.pack(
+                    WordData.FREQ_MAGIC, WordData.FREQ_VERSION, len(freqs), digest
+                )
+            )
+            FILE.write(freqs.astype("<f8").tobytes())
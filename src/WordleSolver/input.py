@@ -38,6 +38,16 @@ class Input:
             if user_input.isdecimal():
                 return float(user_input)
 
+    @staticmethod
+    def get_render_every() -> int:
+        while True:
+            os.system("cls")
+            user_input: str = input(
+                "Redraw every n cases, 0 to redraw by update interval. (e.g. 0): "
+            )
+            if user_input.isdecimal():
+                return int(user_input)
+
     @staticmethod
     def get_case_size(data: InputData) -> int:
         while True:
@@ -0,0 +1,91 @@
+import csv
+import json
+import cProfile
+import dataclasses
+import numpy as np
+from typing import Callable, TypeVar
+from WordleSolver.data_structures import TurnData
+
+T = TypeVar("T")
+
+
+class Metrics:
+    """Opt-in record of where a run spends its time: one TurnData per turn, plus
+    transposition table hits and misses."""
+
+    STAGES: tuple[str, ...] = ("predict", "evaluate", "filter", "display")
+
+    def __init__(self: "Metrics") -> None:
+        self.turns: list[TurnData] = []
+        self.table_hits: int = 0
+        self.table_misses: int = 0
+
+    def start_turn(self: "Metrics", answer: str, turn: int) -> None:
+        self.turns.append(TurnData(answer, turn))
+
+    def add(self: "Metrics", stage: str, seconds: float) -> None:
+        """Adds time spent in a stage to the current turn."""
+        if self.turns:
+            turn: TurnData = self.turns[-1]
+            setattr(turn, stage, getattr(turn, stage) + seconds)
+
+    def set_candidates(self: "Metrics", count: int) -> None:
+        if self.turns:
+            self.turns[-1].candidates = count
+
+    def merge(self: "Metrics", other: "Metrics") -> None:
+        """Appends the records of another run (e.g. a batch worker's game)."""
+        self.turns.extend(other.turns)
+        self.table_hits += other.table_hits
+        self.table_misses += other.table_misses
+
+    def get_summary(self: "Metrics") -> dict[str, object]:
+        """Returns mean and total milliseconds per stage, mean candidates per turn number
+        and the transposition table hit rate."""
+        stages: dict[str, dict[str, float]] = {}
+        for stage in self.STAGES:
+            times: np.ndarray = np.array([getattr(t, stage) for t in self.turns])
+            stages[stage] = {
+                "mean_ms": float(times.mean() * 1000) if len(times) else 0.0,
+                "total_ms": float(times.sum() * 1000),
+            }
+        sizes: dict[int, list[int]] = {}
+        for t in self.turns:
+            if t.candidates is not None:
+                sizes.setdefault(t.turn, []).append(t.candidates)
+        lookups: int = self.table_hits + self.table_misses
+        return {
+            "turns": len(self.turns),
+            "stages": stages,
+            "candidates": {str(n): float(np.mean(c)) for n, c in sorted(sizes.items())},
+            "table_hits": self.table_hits,
+            "table_misses": self.table_misses,
+            "table_hit_rate": self.table_hits / lookups if lookups else 0.0,
+        }
+
+    def save(self: "Metrics", path: str) -> None:
+        """Writes the per-turn records as CSV if the path ends in .csv, otherwise the
+        summary and records as JSON."""
+        fields: list[str] = [f.name for f in dataclasses.fields(TurnData)]
+        with open(path, "w", newline="") as FILE:
+            if path.endswith(".csv"):
+                writer: csv.DictWriter = csv.DictWriter(FILE, fields)
+                writer.writeheader()
+                writer.writerows(dataclasses.asdict(t) for t in self.turns)
+            else:
+                json.dump(
+                    {
+                        "summary": self.get_summary(),
+                        "turns": [dataclasses.asdict(t) for t in self.turns],
+                    },
+                    FILE,
+                )
+
+    @staticmethod
+    def profile(path: str, func: Callable[..., T], *args: object) -> T:
+        """Runs func under cProfile and writes the stats file (for pstats/snakeviz)."""
+        profiler: cProfile.Profile = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args)
+        finally:
+            profiler.dump_stats(path)
@@ -0,0 +1,123 @@
+import numpy as np
+from typing import Tuple
+
+
+class Pattern:
+    """Feedback patterns encoded as base-3 integers.
+
+    Each letter contributes one digit (0 = absent, 1 = present, 2 = correct), with the first
+    letter as the most significant digit, so a 5-letter pattern is an id in 0-242. Ids are
+    stored in the smallest unsigned type that holds 3^length of them."""
+
+    MAX_LENGTH: int = 20  # 3^20 ids still fit in uint32, the widest type get_dtype uses.
+
+    @staticmethod
+    def encode(feedback: Tuple[int, ...]) -> int:
+        """Encodes board feedback (-1 = absent, 0 = present, 1 = correct) into a pattern id."""
+        code: int = 0
+        for f in feedback:
+            code = code * 3 + f + 1
+        return code
+
+    @staticmethod
+    def decode(code: int, length: int = 5) -> Tuple[int, ...]:
+        """Decodes a pattern id back into board feedback."""
+        feedback: list[int] = []
+        for _ in range(length):
+            code, digit = divmod(code, 3)
+            feedback.append(digit - 1)
+        return tuple(reversed(feedback))
+
+    @staticmethod
+    def get_solved(length: int = 5) -> int:
+        """Returns the pattern id of an all-correct guess."""
+        return 3**length - 1
+
+    @staticmethod
+    def get_empty(length: int = 5) -> Tuple[int, ...]:
+        """Returns the feedback of a guess not evaluated yet."""
+        return (-2,) * length
+
+    @staticmethod
+    def get_dtype(length: int = 5) -> np.dtype:
+        """Returns the smallest unsigned type holding every pattern id of a word length."""
+        if length <= Pattern.MAX_LENGTH:
+            for dtype in (np.uint8, np.uint16, np.uint32):
+                if 3**length <= np.iinfo(dtype).max + 1:
+                    return np.dtype(dtype)
+        raise ValueError(f"Words of {length} letters have too many patterns.")
+
+    @staticmethod
+    def get_feedback(guess: str, answer: str) -> Tuple[int, ...]:
+        """Evaluates a single guess against an answer, honoring repeated-letter counts."""
+        feedback: list[int] = [-1 for _ in guess]
+        remaining: dict[str, int] = {}
+        for g, a in zip(guess, answer):
+            if g != a:
+                remaining[a] = remaining.get(a, 0) + 1
+        for i, (g, a) in enumerate(zip(guess, answer)):
+            if g == a:
+                feedback[i] = 1
+            elif remaining.get(g, 0) > 0:
+                feedback[i] = 0
+                remaining[g] -= 1
+        return tuple(feedback)
+
+    @staticmethod
+    def to_array(words: Tuple[str, ...]) -> np.ndarray:
+        """Returns the words as an (n, length) array of letter codes (a = 0 ... z = 25)."""
+        length: int = len(words[0]) if words else 0
+        encoded: bytes = "".join(words).encode("ascii")
+        return (np.frombuffer(encoded, dtype=np.uint8) - ord("a")).reshape(-1, length)
+
+    @staticmethod
+    def get_matrix(
+        guesses: np.ndarray, answers: np.ndarray, chunk_size: int = 256
+    ) -> np.ndarray:
+        """Returns the (guesses, answers) matrix of pattern ids, computed in blocks of guesses."""
+        matrix: np.ndarray = np.empty(
+            (len(guesses), len(answers)), dtype=Pattern.get_dtype(guesses.shape[1])
+        )
+
+        # (letter, answer) counts, so a block's counts are a contiguous row gather.
+        answer_counts: np.ndarray = np.zeros((26, len(answers)), dtype=np.int8)
+        for col in answers.T:
+            answer_counts[col, np.arange(len(answers))] += 1
+
+        for start in range(0, len(guesses), chunk_size):
+            block: np.ndarray = guesses[start : start + chunk_size]
+            matrix[start : start + len(block)] = Pattern._get_block(
+                block, answers, answer_counts
+            )
+        return matrix
+
+    @staticmethod
+    def _get_block(
+        guesses: np.ndarray, answers: np.ndarray, answer_counts: np.ndarray
+    ) -> np.ndarray:
+        """Helper method to compute pattern ids for one block of guesses."""
+        length: int = guesses.shape[1]
+        correct: list[np.ndarray] = [
+            guesses[:, i, None] == answers[None, :, i] for i in range(length)
+        ]
+        codes: np.ndarray = np.zeros(
+            (len(guesses), len(answers)), dtype=Pattern.get_dtype(length)
+        )
+        for i in range(length):
+            letter: np.ndarray = guesses[:, i]
+            same: np.ndarray = guesses == letter[:, None]
+
+            # Copies of the letter in the answer not already taken by a green, minus the
+            # earlier non-green copies in the guess that claimed yellows first.
+            available: np.ndarray = answer_counts[letter]
+            for k in range(length):
+                if not same[:, k].any():
+                    continue
+                if k < i:
+                    available = available - (same[:, k, None] & ~correct[k])
+                if k != i:
+                    available = available - (same[:, k, None] & correct[k])
+            present: np.ndarray = ~correct[i] & (0 < available)
+            codes *= 3
+            codes += correct[i] * np.uint8(2) + present
+        return codes
@@ -0,0 +1,102 @@
+import os
+import csv
+import io
+import json
+from typing import Tuple
+from WordleSolver.data_structures import GameData
+
+
+class ResultWriter:
+    """Appends one record per game to a JSONL file (or CSV if the path ends in .csv),
+    buffered and flushed every `flush_every` games.
+
+    Cases already in the file are listed in `recorded`, so an interrupted sweep resumes
+    where it stopped. A record cut off by the interruption is dropped."""
+
+    FIELDS: Tuple[str, ...] = ("case", "answer", "shots", "seconds", "guesses", "feedback")
+    SYMBOLS: dict[int, str] = {-1: "-", 0: "y", 1: "g"}
+
+    def __init__(self: "ResultWriter", path: str, flush_every: int = 256) -> None:
+        self.path: str = path
+        self.csv: bool = path.endswith(".csv")
+        self.flush_every: int = flush_every
+        self.buffer: list[str] = []
+        self.recorded: set[int] = self.get_recorded()
+
+    def get_recorded(self: "ResultWriter") -> set[int]:
+        """Returns the cases in the file, truncating it after its last complete record."""
+        if not os.path.exists(self.path):
+            return set()
+        recorded: set[int] = set()
+        end: int = 0
+        with open(self.path, "rb") as FILE:
+            if self.csv:
+                FILE.readline()  # Header.
+                end = FILE.tell()
+            for line in FILE:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    recorded.add(
+                        int(json.loads(line)["case"])
+                        if not self.csv
+                        else int(line.split(b",", 1)[0])
+                    )
+                except (ValueError, KeyError):
+                    break
+                end += len(line)
+        with open(self.path, "r+b") as FILE:
+            FILE.truncate(end)
+        return recorded
+
+    def write(self: "ResultWriter", game: GameData) -> None:
+        """Buffers a game's record, flushing if the buffer is full."""
+        if self.csv:
+            line: io.StringIO = io.StringIO()
+            csv.writer(line, lineterminator="\n").writerow(
+                (
+                    game.case,
+                    game.answer,
+                    game.shots,
+                    f"{game.seconds:.6f}",
+                    " ".join(game.guesses),
+                    " ".join(
+                        "".join(self.SYMBOLS[f] for f in fdbk) for fdbk in game.feedback
+                    ),
+                )
+            )
+            self.buffer.append(line.getvalue())
+        else:
+            self.buffer.append(
+                json.dumps(
+                    {
+                        "case": game.case,
+                        "answer": game.answer,
+                        "shots": game.shots,
+                        "seconds": round(game.seconds, 6),
+                        "guesses": list(game.guesses),
+                        "feedback": [list(fdbk) for fdbk in game.feedback],
+                    }
+                )
+                + "\n"
+            )
+        self.recorded.add(game.case)
+        if self.flush_every <= len(self.buffer):
+            self.flush()
+
+    def flush(self: "ResultWriter") -> None:
+        """Appends the buffered records to the file."""
+        if not self.buffer:
+            return
+        new_file: bool = not os.path.exists(self.path) or not os.path.getsize(self.path)
+        with open(self.path, "a", newline="") as FILE:
+            if self.csv and new_file:
+                FILE.write(",".join(self.FIELDS) + "\n")
+            FILE.writelines(self.buffer)
+        self.buffer = []
+
+    def __enter__(self: "ResultWriter") -> "ResultWriter":
+        return self
+
+    def __exit__(self: "ResultWriter", *exc_info: object) -> None:
+        self.flush()
@@ -0,0 +1,274 @@
+import sys
+import json
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import Tuple
+from WordleSolver.batch import Batch, _init_data, _worker
+from WordleSolver.data_structures import SolverData
+from WordleSolver.session import SolverSession
+
+Board = list[Tuple[str, Tuple[int, ...]]]
+
+
+def _advance(
+    requests: list[Tuple[Board, int]],
+) -> list[Tuple[Tuple[Tuple[str, float], ...], int]]:
+    """Ranks guesses for a batch of (board, k) requests in a worker, returns the guesses and
+    the surviving candidate count of each."""
+    data: SolverData = _worker["data"]
+    sessions: list[SolverSession] = []
+    for board, _ in requests:
+        session: SolverSession = SolverSession(data)
+        for guess, fdbk in board:
+            session.play(guess, fdbk)
+        sessions.append(session)
+
+    # One batched call per distinct k.
+    results: list[Tuple[Tuple[str, float], ...]] = [()] * len(requests)
+    for k in set(k for _, k in requests):
+        indices: list[int] = [i for i, (_, r_k) in enumerate(requests) if r_k == k]
+        for i, guesses in zip(
+            indices, SolverSession.advance([sessions[i] for i in indices], k)
+        ):
+            results[i] = guesses
+    return [(guesses, len(s.state.candidates)) for guesses, s in zip(results, sessions)]
+
+
+class RequestError(Exception):
+    """A request the server rejects, with the HTTP status to answer it with."""
+
+    def __init__(self: "RequestError", status: int, message: str) -> None:
+        super().__init__(message)
+        self.status: int = status
+
+
+class Server:
+    """Answers hint requests, {"id": ..., "board": [["crane", [-1, 0, 1, -1, -1]], ...],
+    "k": 10}, with {"id": ..., "guesses": [["slate", 5.87], ...], "candidates": n}, over
+    HTTP (POST /guesses) or newline-delimited JSON on stdin/stdout.
+
+    Requests wait in a bounded queue (a full queue is answered with an error right away)
+    and are ranked in batches on a process pool, so the event loop only parses and
+    replies. A request not answered within the timeout gets an error instead."""
+
+    MAX_BODY: int = 1 << 16
+    MAX_K: int = 100
+    BATCH_SIZE: int = 64
+    REASONS: dict[int, str] = {
+        200: "OK",
+        400: "Bad Request",
+        404: "Not Found",
+        405: "Method Not Allowed",
+        413: "Payload Too Large",
+        500: "Internal Server Error",
+        503: "Service Unavailable",
+        504: "Gateway Timeout",
+    }
+
+    def __init__(
+        self: "Server",
+        data: SolverData,
+        workers: int = 1,
+        queue_size: int = 256,
+        timeout: float = 5.0,
+    ) -> None:
+        self.data: SolverData = data
+        self.workers: int = workers
+        self.timeout: float = timeout
+        self.queue: asyncio.Queue | None = None
+        self.queue_size: int = queue_size
+        self.executor: ProcessPoolExecutor | None = None
+        self.dispatchers: list[asyncio.Task] = []
+
+    @staticmethod
+    def parse(body: bytes) -> Tuple[object, dict]:
+        """Decodes a request body, returns its id and the request."""
+        try:
+            request: dict = json.loads(body)
+        except ValueError:
+            raise RequestError(400, "Request is not valid JSON.")
+        if not isinstance(request, dict):
+            raise RequestError(400, "Request must be a JSON object.")
+        return request.get("id"), request
+
+    @staticmethod
+    def get_board(request: dict, length: int = 5) -> Tuple[Board, int]:
+        """Validates a request for words of the given length, returns its board and k."""
+        k: object = request.get("k", 10)
+        # bool is an int subclass, "k": true is not a count.
+        if type(k) is not int or not 0 < k <= Server.MAX_K:
+            raise RequestError(400, f"k must be an integer in 1..{Server.MAX_K}.")
+        board: Board = []
+        for entry in request.get("board", []):
+            if not (isinstance(entry, list) and len(entry) == 2):
+                raise RequestError(400, "Board entries must be [guess, feedback].")
+            guess, fdbk = entry
+            if not (
+                isinstance(guess, str)
+                and len(guess) == length
+                and guess.isascii()
+                and guess.isalpha()
+            ):
+                raise RequestError(400, f"Invalid guess: {guess!r}.")
+            if not (
+                isinstance(fdbk, list)
+                and len(fdbk) == length
+                and all(f in (-1, 0, 1) and type(f) is int for f in fdbk)
+            ):
+                raise RequestError(400, f"Invalid feedback for {guess!r}.")
+            board.append((guess.lower(), tuple(fdbk)))
+        return board, k
+
+    async def handle(self: "Server", body: bytes) -> Tuple[int, dict]:
+        """Answers one request body, returns the HTTP status and the response."""
+        request_id: object = None
+        try:
+            request_id, request = Server.parse(body)
+            board, k = Server.get_board(request, self.data.word_length)
+            future: asyncio.Future = asyncio.get_running_loop().create_future()
+            try:
+                self.queue.put_nowait((board, k, future))
+            except asyncio.QueueFull:
+                raise RequestError(503, "Server is busy, try again later.")
+            try:
+                guesses, candidates = await asyncio.wait_for(future, self.timeout)
+            except asyncio.TimeoutError:
+                raise RequestError(504, "Request timed out.")
+        except RequestError as e:
+            return e.status, {"id": request_id, "error": str(e)}
+        return 200, {
+            "id": request_id,
+            "guesses": [[w, h] for w, h in guesses],
+            "candidates": candidates,
+        }
+
+    async def dispatch(self: "Server") -> None:
+        """Takes queued requests in batches and ranks them on the process pool."""
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        while True:
+            batch: list[Tuple[Board, int, asyncio.Future]] = [await self.queue.get()]
+            while len(batch) < self.BATCH_SIZE and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+
+            # Timed out requests are not ranked.
+            batch = [request for request in batch if not request[2].done()]
+            if not batch:
+                continue
+            try:
+                results: list = await loop.run_in_executor(
+                    self.executor, _advance, [(board, k) for board, k, _ in batch]
+                )
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(RequestError(500, f"Ranking failed: {e}"))
+                continue
+            for (_, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def handle_http(
+        self: "Server", reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serves one HTTP request per connection."""
+        status: int
+        response: dict
+        try:
+            request_line: bytes = await asyncio.wait_for(reader.readline(), self.timeout)
+            method, path, _ = request_line.decode("latin-1").split(" ", 2)
+            headers: dict[str, str] = {}
+            while True:
+                line: bytes = await asyncio.wait_for(reader.readline(), self.timeout)
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length: int = int(headers.get("content-length", 0))
+            if path != "/guesses":
+                status, response = 404, {"error": f"Unknown path {path}."}
+            elif method != "POST":
+                status, response = 405, {"error": "Use POST."}
+            elif not 0 <= length <= self.MAX_BODY:
+                status, response = 413, {"error": "Request body too large."}
+            else:
+                body: bytes = await asyncio.wait_for(
+                    reader.readexactly(length), self.timeout
+                )
+                status, response = await self.handle(body)
+        except (ValueError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+            status, response = 400, {"error": "Malformed HTTP request."}
+
+        payload: bytes = json.dumps(response).encode("utf-8")
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {self.REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode("latin-1")
+            + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_http(self: "Server", host: str = "127.0.0.1", port: int = 8080) -> None:
+        async with self:
+            server: asyncio.Server = await asyncio.start_server(
+                self.handle_http, host, port
+            )
+            print(f"Serving on http://{host}:{port}/guesses", file=sys.stderr)
+            async with server:
+                await server.serve_forever()
+
+    async def serve_stdio(self: "Server") -> None:
+        """Answers one JSON request per stdin line with one JSON line on stdout, in
+        completion order (match them by id). Returns at end of input."""
+        async with self:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+            reader: asyncio.StreamReader = asyncio.StreamReader(limit=self.MAX_BODY)
+            await loop.connect_read_pipe(
+                lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+            )
+
+            async def answer(line: bytes) -> None:
+                _, response = await self.handle(line)
+                sys.stdout.write(json.dumps(response) + "\n")
+                sys.stdout.flush()
+
+            pending: set[asyncio.Task] = set()
+            while True:
+                try:
+                    line: bytes = await reader.readline()
+                except ValueError:
+                    sys.stdout.write(json.dumps({"error": "Request too large."}) + "\n")
+                    continue
+                if not line:
+                    break
+                if line.strip():
+                    task: asyncio.Task = asyncio.create_task(answer(line))
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.wait(pending)
+
+    async def __aenter__(self: "Server") -> "Server":
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_data,
+            initargs=Batch.share(self.data),
+        )
+        # Workers start now, not on the first request: forked later, they would inherit
+        # (and keep open) the client sockets of that moment.
+        await asyncio.get_running_loop().run_in_executor(self.executor, int)
+        self.queue = asyncio.Queue(self.queue_size)
+        self.dispatchers = [
+            asyncio.create_task(self.dispatch()) for _ in range(self.workers)
+        ]
+        return self
+
+    async def __aexit__(self: "Server", *exc_info: object) -> None:
+        for task in self.dispatchers:
+            task.cancel()
+        self.executor.shutdown(cancel_futures=True)
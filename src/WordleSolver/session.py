@@ -0,0 +1,90 @@
+import numpy as np
+from typing import Sequence, Tuple
+from WordleSolver.algo import Entropy
+from WordleSolver.cache import OpenerCache, TranspositionTable
+from WordleSolver.data_structures import SolverData
+from WordleSolver.state import GameState
+from WordleSolver.utils import EntropyCalc
+
+
+class SolverSession:
+    """One game served through the library: the shared solver data (word list, pattern
+    matrix, index, openers; never modified by sessions) plus this game's candidates.
+
+    Sessions are cheap, so a service keeps one per player and asks for hints with
+    SolverSession.advance, which ranks many sessions in one call."""
+
+    __slots__ = ("data", "state")
+
+    def __init__(self: "SolverSession", data: SolverData) -> None:
+        self.data: SolverData = data
+        self.state: GameState = GameState(data)
+
+    @property
+    def candidates(self: "SolverSession") -> Tuple[str, ...]:
+        """The words that can still be the answer."""
+        return tuple([self.data.considered_words[i] for i in self.state.candidates])
+
+    def play(self: "SolverSession", guess: str, fdbk: Tuple[int, ...]) -> None:
+        """Applies the feedback (-1 absent, 0 present, 1 correct) for a guess."""
+        self.state.narrow(guess, tuple(fdbk))
+
+    def get_guesses(
+        self: "SolverSession", k: int = 10
+    ) -> Tuple[Tuple[str, float], ...]:
+        """Returns the top k guesses with their entropy, as Entropy.predict does."""
+        return SolverSession.advance((self,), k)[0]
+
+    @staticmethod
+    def advance(
+        sessions: Sequence["SolverSession"], k: int = 10
+    ) -> list[Tuple[Tuple[str, float], ...]]:
+        """Returns the top k guesses for each session (sharing the same data). Sessions
+        with the same candidates are ranked once, positions in the transposition table or
+        the opener table are not ranked at all, and the rest are scored together."""
+        if not sessions:
+            return []
+        data: SolverData = sessions[0].data
+        variant: str = OpenerCache.get_variant(data)
+        # The table holds the top 10 of a position, as Entropy.predict ranks.
+        table: TranspositionTable | None = data.transpositions if k <= 10 else None
+        results: dict[bytes, Tuple[Tuple[str, float], ...]] = {}
+        pending: dict[bytes, np.ndarray] = {}
+        keys: list[bytes] = []
+        for session in sessions:
+            key: bytes = TranspositionTable.get_key(session.state.candidates, variant)
+            keys.append(key)
+            if key in results or key in pending:
+                continue
+            # The opener tables hold the top RANKED guesses of boards with at most one
+            # guess (a dict would merge a repeated guess into one).
+            history: list[Tuple[str, Tuple[int, ...]]] = session.state.history
+            found: Tuple[Tuple[str, float], ...] | None = None
+            if k <= OpenerCache.RANKED and len(history) <= 1:
+                found = Entropy.get_precomputed(data, dict(history))
+            if found is None and table is not None:
+                found = table.get(key)
+            if found is not None:
+                results[key] = found[:k]
+            else:
+                pending[key] = session.state.candidates
+
+        # Hard mode guesses among the candidates, soft mode from the whole list.
+        all_ids: np.ndarray = np.arange(len(data.considered_words))
+        problems: list[Tuple[np.ndarray, np.ndarray]] = [
+            (ids if data.hard_mode else all_ids, ids) for ids in pending.values()
+        ]
+        if data.ranking == "weighted":
+            ranked: list[list[Tuple[int, float]]] = [
+                EntropyCalc.get_ranked(
+                    data.patterns, guesses, ids, k, weights=data.priors[ids]
+                )
+                for guesses, ids in problems
+            ]
+        else:
+            ranked = EntropyCalc.get_ranked_batch(data.patterns, problems, k)
+        for key, guesses in zip(pending, ranked):
+            results[key] = tuple([(data.considered_words[i], h) for i, h in guesses])
+            if table is not None and k == 10:
+                table.put(key, results[key])
+        return [results[key] for key in keys]
@@ -1,45 +1,119 @@
 import os
 import sys
+import numpy as np
 from importlib.resources import files
 from typing import Tuple, Type
 from WordleSolver.initialize import WordData
+from WordleSolver.cache import PatternCache, OpenerCache, TranspositionTable
+from WordleSolver.index import WordIndex
 from WordleSolver.data_structures import SolverData, InitData, InputData
 from WordleSolver.algo import Context, Algorithm
 from WordleSolver.input import Input
+from WordleSolver.utils import EntropyCalc
 
 
 class Solver:
-    def __init__(self: "Solver", context: Context) -> None:
-        """Initialization."""
+    def __init__(
+        self: "Solver",
+        context: Context,
+        threshold: float | None = None,
+        word_length: int = 5,
+        allowed_guesses: int = Context.ALLOWED_GUESSES,
+        hard_mode: bool = True,
+        ranking: str = "entropy",
+    ) -> None:
+        """Initialization. Prompts for the frequency threshold unless one is given. The
+        openers loaded are those of the Entropy variant given by hard_mode and ranking."""
+        self.word_length: int = word_length
+        self.allowed_guesses: int = allowed_guesses
         self.init_data: InitData = InitData(
             os.path.dirname(sys.argv[0]),
-            files("WordleSolver") / "data"
+            files("WordleSolver") / "data",
+            self._get_cache_path(),
         )
-        self.solver_data = self._get_solver_data()
+        self.solver_data = self._get_solver_data(threshold)
+        self.solver_data.hard_mode = hard_mode
+        self.solver_data.ranking = ranking
+        self.load_openers()
         self.context = context
 
-    def _get_solver_data(self: "Solver") -> SolverData:
+    @staticmethod
+    def _get_cache_path() -> str:
+        """Helper method to get the per-user cache directory."""
+        if "WORDLE_SOLVER_CACHE" in os.environ:
+            return os.environ["WORDLE_SOLVER_CACHE"]
+        base: str = os.environ.get("LOCALAPPDATA") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        return os.path.join(base, "WordleSolver")
+
+    def _get_solver_data(self: "Solver", threshold: float | None) -> SolverData:
         """Helper method to get solver data."""
-        considered_words: Tuple[str, ...] = WordData.get_words(self.init_data)
-        freq_threshold: float = Input.get_threshold()
+        considered_words: Tuple[str, ...] = WordData.get_words(
+            self.init_data, self.word_length
+        )
+        freq_threshold: float = (
+            Input.get_threshold() if threshold is None else threshold
+        )
+        self.freq_threshold: float = freq_threshold
 
         final_word_list: list[str] = []
         final_word_freq: dict[str, float] = {}
         for word, freq in zip(
-            considered_words, WordData.get_freqs(considered_words).values()
+            considered_words,
+            WordData.get_freqs(self.init_data, considered_words).values(),
         ):
             if freq_threshold < freq:
                 final_word_list.append(word)
                 final_word_freq[word] = freq
+        if not final_word_list:
+            raise ValueError(
+                f"No {self.word_length}-letter words above the threshold {freq_threshold}."
+            )
         solver_data: SolverData = SolverData(
-            tuple(final_word_list), final_word_freq, 0.0, 1
+            tuple(final_word_list),
+            final_word_freq,
+            0.0,
+            1,
+            word_length=self.word_length,
+            allowed_guesses=self.allowed_guesses,
+        )
+
+        # Feedback of every guess against every answer, precomputed once and cached.
+        solver_data.patterns = PatternCache.get_matrix(
+            self.init_data.cache_path, solver_data.considered_words, freq_threshold
+        )
+        solver_data.word_index = WordIndex(solver_data.considered_words)
+        solver_data.cache_path = self.init_data.cache_path
+        solver_data.cache_key = PatternCache.get_key(
+            solver_data.considered_words, freq_threshold
+        ).hex()
+        solver_data.transpositions = TranspositionTable()
+        solver_data.priors = EntropyCalc.get_priors(
+            np.array(tuple(final_word_freq.values()))
         )
         return solver_data
 
+    def load_openers(self: "Solver") -> None:
+        """Loads the precomputed first and second guesses for the active Entropy variant.
+        Call again after changing hard_mode or ranking."""
+        self.solver_data.openers, self.solver_data.second_guesses = (
+            OpenerCache.get_openers(
+                self.init_data.cache_path, self.solver_data, self.freq_threshold
+            )
+        )
+        self.solver_data.opener_variant = OpenerCache.get_variant(self.solver_data)
+
+    def get_table_path(self: "Solver") -> str:
+        """Returns the file path the transposition table persists to between runs."""
+        return TranspositionTable.get_path(
+            self.init_data.cache_path, self.solver_data.cache_key
+        )
+
     def start(self: "Solver") -> None:
         """Main program loop."""
         algorithms: dict[str, Type["Algorithm"]] = self.context.get_algorithms()
-        modes: tuple[str, str] = self.context.get_modes()
+        modes: tuple[str, ...] = self.context.get_modes()
         input_data: InputData = InputData(
             tuple(algorithms.keys()),
             modes,
@@ -50,10 +124,11 @@ class Solver:
         while True:
             input_algorithm: str = Input.get_algorithm(input_data)
             mode: str = Input.get_mode(input_data)
-            if mode != "Real-time":
+            if mode == "Pre-defined":
                 self.solver_data.update_interval = Input.get_interval()
+                self.solver_data.render_every = Input.get_render_every()
                 self.solver_data.case_size = Input.get_case_size(input_data)
-            else:
+            elif mode == "Real-time":
                 self.solver_data.case_size = 1
 
             self.context.execute(input_algorithm, mode, self.solver_data)
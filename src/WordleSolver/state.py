@@ -0,0 +1,55 @@
+import numpy as np
+from typing import Tuple
+from WordleSolver.data_structures import SolverData
+from WordleSolver.patterns import Pattern
+
+
+class GameState:
+    """Surviving candidates of one game, narrowed one board entry at a time."""
+
+    def __init__(self: "GameState", data: SolverData) -> None:
+        self.data: SolverData = data
+        self.candidates: np.ndarray = np.arange(len(data.considered_words))
+        self.history: list[Tuple[str, Tuple[int, ...]]] = []
+
+    def reset(self: "GameState") -> None:
+        """Restores the full candidate set for a new game."""
+        self.candidates = np.arange(len(self.data.considered_words))
+        self.history = []
+
+    def update(self: "GameState", board: dict[str, Tuple[int, ...]]) -> np.ndarray:
+        """Applies the board entries not seen yet and returns the surviving candidate ids.
+        Starts over if the board does not continue the game seen so far."""
+        entries: list[Tuple[str, Tuple[int, ...]]] = [
+            (guess, fdbk) for guess, fdbk in board.items() if -2 not in fdbk
+        ]
+        if entries[: len(self.history)] != self.history:
+            self.reset()
+        for guess, fdbk in entries[len(self.history) :]:
+            self.narrow(guess, fdbk)
+        return self.candidates
+
+    def get_row(self: "GameState", guess: str) -> np.ndarray:
+        """Returns the pattern ids of the guess against each surviving candidate."""
+        guess_id: int | None = self.data.word_index.ids.get(guess)
+        if guess_id is not None and self.data.patterns is not None:
+            return self.data.patterns[guess_id, self.candidates]
+        # Guess outside the word list (Real-time), evaluate it against the survivors.
+        return Pattern.get_matrix(
+            Pattern.to_array((guess,)),
+            self.data.word_index.letters[self.candidates],
+        )[0]
+
+    def narrow(
+        self: "GameState",
+        guess: str,
+        fdbk: Tuple[int, ...],
+        row: np.ndarray | None = None,
+    ) -> None:
+        """Keeps only the candidates that would have produced this feedback for the guess
+        (row: get_row of the guess, if already computed)."""
+        code: int = Pattern.encode(fdbk)
+        if row is None:
+            row = self.get_row(guess)
+        self.candidates = self.candidates[row == code]
+        self.history.append((guess, fdbk))
@@ -0,0 +1,171 @@
+import os
+import json
+import hashlib
+import numpy as np
+from typing import Tuple
+from WordleSolver.cache import atomic_write
+from WordleSolver.data_structures import SolverData
+from WordleSolver.patterns import Pattern
+from WordleSolver.utils import EntropyCalc
+
+
+class TreeBuilder:
+    """Builds a decision tree minimizing the total number of guesses over a candidate set.
+
+    At each node only the top `width` guesses by entropy are tried (pruning), each
+    subtree is cut off as soon as its cost plus a lower bound on the rest exceeds the best
+    guess so far (branch and bound), and solved subproblems are memoized by the
+    fingerprint of their candidate set."""
+
+    FAIL_PENALTY: int = 100  # Extra cost of an answer found after the guess budget.
+
+    def __init__(
+        self: "TreeBuilder", data: SolverData, width: int, max_depth: int
+    ) -> None:
+        self.data: SolverData = data
+        self.width: int = width
+        self.max_depth: int = max_depth
+        self.solved: int = Pattern.get_solved(data.word_length)
+        self.letters: np.ndarray = data.word_index.letters
+        self.all_ids: np.ndarray = np.arange(len(data.considered_words))
+        self.memo: dict[Tuple[bytes, int], Tuple[float, dict]] = {}
+
+    def solve(self: "TreeBuilder", candidates: np.ndarray, depth: int) -> Tuple[float, dict]:
+        """Returns the total guess count and subtree for the candidates, guessed at depth."""
+        size: int = len(candidates)
+        if size == 1:
+            cost: float = 1 if depth <= self.max_depth else 1 + self.FAIL_PENALTY
+            return cost, {"guess": self.data.considered_words[candidates[0]], "size": 1}
+
+        key: Tuple[bytes, int] = (
+            hashlib.blake2b(candidates.tobytes(), digest_size=16).digest(),
+            depth,
+        )
+        if key in self.memo:
+            return self.memo[key]
+
+        guess_ids: np.ndarray = candidates if self.data.hard_mode else self.all_ids
+        best_cost: float = float("inf")
+        best_node: dict = {}
+        for guess, entropy in EntropyCalc.get_ranked(
+            self.data.patterns, guess_ids, candidates, self.width, letters=self.letters
+        ):
+            if entropy <= 0:
+                continue  # Does not split the candidates, no progress.
+            row: np.ndarray = np.asarray(self.data.patterns[guess, candidates])
+            codes, counts = np.unique(row, return_counts=True)
+            unsolved: np.ndarray = codes != self.solved
+
+            # Every candidate pays this guess, plus at least 2m - 1 guesses per bucket of m.
+            cost = size + (self.FAIL_PENALTY * size if self.max_depth < depth else 0)
+            lower: int = int(np.sum(2 * counts[unsolved] - 1))
+            children: dict[str, dict] = {}
+            for code, count in sorted(
+                zip(codes[unsolved], counts[unsolved]), key=lambda t: -t[1]
+            ):
+                lower -= 2 * int(count) - 1
+                sub_cost, sub_node = self.solve(candidates[row == code], depth + 1)
+                cost += sub_cost
+                if best_cost <= cost + lower:
+                    break
+                children[str(int(code))] = sub_node
+            else:
+                if cost < best_cost:
+                    best_cost = cost
+                    best_node = {
+                        "guess": self.data.considered_words[guess],
+                        "size": size,
+                        "next": children,
+                    }
+
+        self.memo[key] = (best_cost, best_node)
+        return best_cost, best_node
+
+
+class DecisionTree:
+    """Guess -> feedback -> subtree over the answer list. Playing a game is a walk from the
+    root, and the tree's depth bounds the guesses any answer needs."""
+
+    VERSION: int = 1
+
+    def __init__(self: "DecisionTree", root: dict) -> None:
+        self.root: dict = root
+
+    @staticmethod
+    def build(data: SolverData, width: int = 3, max_depth: int = 6) -> "DecisionTree":
+        """Builds the tree over all considered words."""
+        builder: TreeBuilder = TreeBuilder(data, width, max_depth)
+        _, root = builder.solve(np.arange(len(data.considered_words)), 1)
+        return DecisionTree(root)
+
+    @staticmethod
+    def get_path(data: SolverData, width: int) -> str:
+        """Returns the cache file path of the tree for a word list, mode, width and guess
+        limit."""
+        mode: str = "hard" if data.hard_mode else "soft"
+        if data.allowed_guesses != 6:
+            mode += f"-g{data.allowed_guesses}"
+        return os.path.join(
+            data.cache_path,
+            f"tree-v{DecisionTree.VERSION}-{data.cache_key[:16]}-{mode}-w{width}.json",
+        )
+
+    @staticmethod
+    def load(path: str) -> "DecisionTree | None":
+        """Reads a serialized tree, returns None if missing or unreadable."""
+        try:
+            with open(path, "r") as FILE:
+                return DecisionTree(json.load(FILE))
+        except (OSError, ValueError):
+            return None
+
+    def save(self: "DecisionTree", path: str) -> None:
+        """Serializes the tree to disk, replacing any existing file atomically."""
+        with atomic_write(path) as FILE:
+            json.dump(self.root, FILE, separators=(",", ":"))
+
+    @staticmethod
+    def get_tree(data: SolverData, width: int = 3) -> "DecisionTree":
+        """Loads the cached tree, building and caching it if missing."""
+        path: str = DecisionTree.get_path(data, width)
+        tree: DecisionTree | None = DecisionTree.load(path) if data.cache_path else None
+        if tree is None:
+            tree = DecisionTree.build(data, width, data.allowed_guesses)
+            if data.cache_path:
+                try:
+                    tree.save(path)
+                except OSError:
+                    pass
+        return tree
+
+    def walk(self: "DecisionTree", board: dict[str, Tuple[int, ...]]) -> dict | None:
+        """Follows the board from the root, returns None if it leaves the tree."""
+        node: dict = self.root
+        for guess, fdbk in board.items():
+            if -2 in fdbk:
+                continue
+            if node.get("guess") != guess:
+                return None
+            node = node.get("next", {}).get(str(Pattern.encode(fdbk)))
+            if node is None:
+                return None
+        return node
+
+    def get_depth(self: "DecisionTree", node: dict | None = None) -> int:
+        """Returns the worst-case number of guesses under a node (the root by default)."""
+        node = self.root if node is None else node
+        return 1 + max(
+            (self.get_depth(child) for child in node.get("next", {}).values()),
+            default=0,
+        )
+
+    def get_mean(self: "DecisionTree") -> float:
+        """Returns the average number of guesses over all answers."""
+        total: int = 0
+        stack: list[Tuple[dict, int]] = [(self.root, 1)]
+        while stack:
+            node, depth = stack.pop()
+            children: dict = node.get("next", {})
+            total += depth * (node["size"] - sum(c["size"] for c in children.values()))
+            stack.extend((child, depth + 1) for child in children.values())
+        return total / self.root["size"]
@@ -1,44 +1,416 @@
-from typing import Tuple, TYPE_CHECKING
-from math import log2
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Sequence, Tuple
 
-if TYPE_CHECKING:
-    from WordleSolver.algo import Auto
 
+class EntropyCalc:
+    PAIRWISE_LIMIT: int = 12
 
-class WordVector:
-    map_to_num = {k: v for k, v in zip("abcdefghijklmnopqrstuvwxyz", range(26))}
+    @staticmethod
+    def get_entropy(row: np.ndarray) -> float:
+        """Returns the entropy of a single guess given its pattern ids against the candidates."""
+        return float(EntropyCalc.get_entropies(row[None, :])[0])
 
-    def __init__(self: "WordVector", string: str) -> None:
-        self._vector: list[int] = [0 for _ in range(26)]
-        for c in string:
-            self._vector[self.map_to_num[c]] += 1
+    @staticmethod
+    def get_priors(
+        frequencies: np.ndarray, center: float = -6.0, width: float = 0.5
+    ) -> np.ndarray:
+        """Returns the prior probability of each word being an answer, a sigmoid over the
+        log10 of its frequency (a word with frequency 10**center is a coin flip)."""
+        log_freq: np.ndarray = np.log10(np.maximum(frequencies, 1e-12))
+        return 1 / (1 + np.exp(-(log_freq - center) / width))
+
+    @staticmethod
+    def get_pairwise(rows: np.ndarray) -> np.ndarray:
+        """Returns the entropy of each row of pattern ids (any leading shape, few candidates
+        along the last axis) from each candidate's bucket size, H = log2(n) - mean(log2(b))."""
+        word_list_len: int = rows.shape[-1]
+        bucket: np.ndarray = np.sum(
+            rows[..., :, None] == rows[..., None, :], axis=-1, dtype=np.intp
+        )
+        log_bucket: np.ndarray = np.log2(np.arange(1, word_list_len + 1))
+        entropy: np.ndarray = np.log2(word_list_len) - log_bucket[bucket - 1].mean(axis=-1)
+        return np.maximum(entropy, 0.0)
 
-    def get_vector(self: "WordVector") -> Tuple[int, ...]:
-        return tuple(self._vector)
+    @staticmethod
+    def get_renumbered(rows: np.ndarray) -> Tuple[np.ndarray, int]:
+        """Returns the pattern ids renumbered 0..size - 1 in order, over the ids that occur,
+        and size. Ids sparser than the rows (long words) are sorted instead of marked in an
+        array as large as the highest id."""
+        if not rows.size:
+            return rows, 1
+        size: int = int(rows.max()) + 1
+        if rows.size < size:
+            ids, inverse = np.unique(rows, return_inverse=True)
+            return inverse.reshape(rows.shape), len(ids)
+        present: np.ndarray = np.zeros(size, dtype=bool)
+        present[rows.ravel()] = True
+        if present.sum() < size:
+            return (np.cumsum(present) - 1)[rows], int(present.sum())
+        return rows, size
 
     @staticmethod
-    def in_sup_vector(sub_vector: "WordVector", sup_vector: "WordVector") -> bool:
-        """Checks if sub-vector is within sup-vector. Each element in sub_vector must be <= the corresponding
-        element in the sup-vector."""
-        for x, y in zip(sub_vector.get_vector(), sup_vector.get_vector()):
-            if x > y:
-                return False
-        return True
+    def get_entropies(
+        rows: np.ndarray, weights: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Returns the entropy of each guess (row) given its pattern ids against the candidates
+        (columns), counting patterns of all rows in a single bincount. With weights (one per
+        candidate) the pattern distribution is weighted by them instead of uniform."""
+        guess_count, word_list_len = rows.shape
+        if not rows.size:
+            return np.zeros(guess_count)
+        entropy: np.ndarray
+        probs: np.ndarray | None = None if weights is None else weights / weights.sum()
 
+        # Few candidates: each candidate's bucket size (or mass) from pairwise comparisons,
+        # as H = -sum(p_i * log2(bucket mass of i)).
+        if word_list_len <= EntropyCalc.PAIRWISE_LIMIT:
+            same: np.ndarray = rows[:, :, None] == rows[:, None, :]
+            if probs is not None:
+                mass: np.ndarray = np.sum(same * probs, axis=2)
+                entropy = -np.sum(probs * np.log2(mass), axis=1)
+                return np.maximum(entropy, 0.0)
+            return EntropyCalc.get_pairwise(rows)
+
+        # Renumber the patterns that occur, so few candidates mean few bins.
+        rows, size = EntropyCalc.get_renumbered(rows)
+
+        offsets: np.ndarray = np.arange(guess_count)[:, None] * size
+        flat: np.ndarray = (rows + offsets).ravel()
+        if probs is not None:
+            p_mass: np.ndarray = np.bincount(
+                flat,
+                weights=np.broadcast_to(probs, rows.shape).ravel(),
+                minlength=guess_count * size,
+            ).reshape(guess_count, size)
+            p_log_p: np.ndarray = np.zeros_like(p_mass)
+            np.log2(p_mass, out=p_log_p, where=0 < p_mass)
+            entropy = -np.sum(p_mass * p_log_p, axis=1)
+            return np.maximum(entropy, 0.0)
+
+        p_count: np.ndarray = np.bincount(flat, minlength=guess_count * size).reshape(
+            guess_count, size
+        )
+
+        # H = log2(n) - sum(c * log2(c)) / n over the pattern counts c, with c * log2(c)
+        # looked up from a table as counts never exceed n.
+        counts: np.ndarray = np.arange(word_list_len + 1)
+        c_log_c: np.ndarray = counts * np.log2(np.maximum(counts, 1))
+        entropy = (
+            np.log2(word_list_len) - c_log_c[p_count].sum(axis=1) / word_list_len
+        )
+        return np.maximum(entropy, 0.0)
+
+    @staticmethod
+    def get_scores(
+        matrix: np.ndarray,
+        guesses: np.ndarray,
+        answers: np.ndarray,
+        max_elements: int = 1 << 22,
+        workers: int = 1,
+        weights: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Returns the entropy of each guess id against the answer ids (weighted by weights,
+        one per answer, if given). Guesses are scored in blocks of at most max_elements
+        patterns to bound memory, on worker threads if > 1."""
+        if not len(answers):
+            return np.zeros(len(guesses))
+        step: int = max(1, max_elements // len(answers))
+        blocks: list[np.ndarray] = [
+            guesses[s : s + step] for s in range(0, len(guesses), step)
+        ]
+
+        def score(block: np.ndarray) -> np.ndarray:
+            return EntropyCalc.get_entropies(
+                np.asarray(matrix[np.ix_(block, answers)]), weights
+            )
+
+        if 1 < workers and 1 < len(blocks):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return np.concatenate(list(executor.map(score, blocks)))
+        return np.concatenate([score(block) for block in blocks])
+
+    @staticmethod
+    def get_bounds(guess_letters: np.ndarray, answer_letters: np.ndarray) -> np.ndarray:
+        """Returns an upper bound on the entropy of each guess against the answers, from
+        letter counts alone: a pattern's entropy is at most the sum of its positions'
+        entropies, and at most log2 of the answer count.
+
+        A position is green if the answer has the guess letter there, otherwise yellow
+        exactly when the answer has it elsewhere if the guess has the letter once. For a
+        repeated letter only the green share is known, leaving at most 1 bit for the rest."""
+        n, length = answer_letters.shape
+        if not n:
+            return np.zeros(len(guess_letters))
+        positions: np.ndarray = np.arange(length)
+        green: np.ndarray = np.bincount(
+            (positions * 26 + answer_letters).ravel(), minlength=length * 26
+        ).reshape(length, 26)
+        present: np.ndarray = np.zeros((n, 26), dtype=bool)
+        present[np.arange(n)[:, None], answer_letters] = True
+        contains: np.ndarray = present.sum(axis=0)
+
+        def p_log_p(p: np.ndarray) -> np.ndarray:
+            out: np.ndarray = np.zeros_like(p)
+            np.log2(p, out=out, where=0 < p)
+            return -p * out
+
+        # Entropy of a position's feedback per (position, letter), as a once-only letter
+        # and as a repeated one.
+        p_green: np.ndarray = green / n
+        p_yellow: np.ndarray = contains / n - p_green
+        single: np.ndarray = (
+            p_log_p(p_green)
+            + p_log_p(p_yellow)
+            + p_log_p(np.maximum(1 - p_green - p_yellow, 0.0))
+        )
+        repeated: np.ndarray = p_log_p(p_green) + p_log_p(1 - p_green) + (1 - p_green)
+        is_repeated: np.ndarray = np.zeros(guess_letters.shape, dtype=bool)
+        for i in range(length):
+            for j in range(i + 1, length):
+                same: np.ndarray = guess_letters[:, i] == guess_letters[:, j]
+                is_repeated[:, i] |= same
+                is_repeated[:, j] |= same
+        entropy: np.ndarray = np.concatenate((single.ravel(), repeated.ravel()))[
+            (is_repeated * length + positions) * 26 + guess_letters
+        ]
+        return np.minimum(entropy.sum(axis=1), np.log2(n))
+
+    @staticmethod
+    def get_pruned(
+        matrix: np.ndarray,
+        guesses: np.ndarray,
+        answers: np.ndarray,
+        letters: np.ndarray,
+        k: int = 10,
+        workers: int = 1,
+        first: int = 256,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scores only the guesses that can make the top k: in order of their bound
+        (get_bounds), a doubling block at a time, until the next bound is below the k-th
+        best score so far. Returns the scored guess ids (in their given order) and their
+        entropies. letters holds the (n, length) letter codes of every word id."""
+        bounds: np.ndarray = EntropyCalc.get_bounds(letters[guesses], letters[answers])
+        order: np.ndarray = np.argsort(-bounds, kind="stable")
+        scores: np.ndarray = np.full(len(guesses), -np.inf)
+        kth: float = -np.inf
+        done: int = 0
+        step: int = max(first, k)
+        # A bound equal to the k-th score may still tie with it.
+        while done < len(order) and kth - 1e-9 <= bounds[order[done]]:
+            block: np.ndarray = order[done : done + step]
+            scores[block] = EntropyCalc.get_scores(
+                matrix, guesses[block], answers, workers=workers
+            )
+            done += len(block)
+            step *= 2
+            kth = float(np.partition(scores, len(scores) - k)[len(scores) - k])
+        scored: np.ndarray = np.sort(order[:done])
+        return guesses[scored], scores[scored]
+
+    @staticmethod
+    def get_top(
+        guesses: np.ndarray, scores: np.ndarray, is_answer: np.ndarray, k: int = 10
+    ) -> list[Tuple[int, float]]:
+        """Returns the k best guesses as (id, score). Ties go to guesses that can still be
+        the answer, then to the earlier guess. Only the guesses scoring at least the k-th
+        best (found with a partition) are sorted."""
+        top: np.ndarray = np.arange(len(scores))
+        if k < len(scores):
+            kth: float = np.partition(scores, len(scores) - k)[len(scores) - k]
+            top = np.flatnonzero(kth <= scores)
+        ranked: np.ndarray = top[np.lexsort((~is_answer[top], -scores[top]))][:k]
+        return [(int(guesses[i]), float(scores[i])) for i in ranked]
 
-class EntropyCalc:
     @staticmethod
-    def get_entropy(
-        word_list: Tuple[str, ...], guess: str, patterns: Tuple[Tuple[int, ...], ...], eval: "Auto"
-    ) -> float:
-        p_count: dict[Tuple[int, ...], int] = {k: 0 for k in patterns}
-        for word in word_list:
-            word_pattern: dict[str, Tuple[int, ...]] = {word: (-2, -2, -2, -2, -2)}
-            eval.evaluate(word_pattern, guess)
-            p_count[word_pattern[word]] += 1
-        entropy: float = 0.0
-        word_list_len: int = len(word_list)
-        for p in p_count:
-            prob: float = p_count[p] / word_list_len
-            entropy += prob * (log2(prob) if prob else 0)
-        return -entropy if entropy != 0 else 0
+    def get_ranked(
+        matrix: np.ndarray,
+        guesses: np.ndarray,
+        answers: np.ndarray,
+        k: int = 10,
+        workers: int = 1,
+        weights: np.ndarray | None = None,
+        letters: np.ndarray | None = None,
+    ) -> list[Tuple[int, float]]:
+        """Returns the top k guess ids by entropy as (id, entropy). Ties go to guesses that
+        can still be the answer, then to the lower id. Given the letters of every word id,
+        guesses that cannot make the top k are pruned unscored (see get_pruned) once there
+        are enough guesses and answers for the bounds to pay off.
+
+        With weights (answer priors), the score is the weighted entropy H plus the chance p
+        that the guess is the answer times what a hit is worth over H: a hit resolves all
+        remaining entropy R, so score = (1 - p) * H + p * R."""
+        scores: np.ndarray
+        if (
+            weights is None
+            and letters is not None
+            and max(k, 256) < len(guesses)
+            and EntropyCalc.PAIRWISE_LIMIT < len(answers)
+        ):
+            guesses, scores = EntropyCalc.get_pruned(
+                matrix, guesses, answers, letters, k, workers
+            )
+        else:
+            scores = EntropyCalc.get_scores(
+                matrix, guesses, answers, workers=workers, weights=weights
+            )
+        is_answer: np.ndarray = np.isin(guesses, answers)
+        if weights is not None:
+            probs: np.ndarray = weights / weights.sum()
+            order: np.ndarray = np.argsort(answers)
+            prob: np.ndarray = np.zeros(len(guesses))
+            prob[is_answer] = probs[
+                order[np.searchsorted(answers[order], guesses[is_answer])]
+            ]
+            remaining: float = -float(np.sum(probs * np.log2(probs)))
+            scores = (1 - prob) * scores + prob * remaining
+        return EntropyCalc.get_top(guesses, scores, is_answer, k)
+
+    @staticmethod
+    def get_combined(
+        matrix: np.ndarray,
+        guesses: np.ndarray,
+        boards: Sequence[np.ndarray],
+        max_elements: int = 1 << 22,
+        workers: int = 1,
+    ) -> np.ndarray:
+        """Returns the entropy of each guess id summed over several boards' answer ids. The
+        answers of all boards are gathered from the matrix together, then each board's
+        columns are counted on their own, so a board costs one more bincount."""
+        boards = [ids for ids in boards if len(ids)]
+        if not boards:
+            return np.zeros(len(guesses))
+        answers: np.ndarray = np.concatenate(boards)
+        bounds: np.ndarray = np.cumsum([0] + [len(ids) for ids in boards])
+        step: int = max(1, max_elements // len(answers))
+        blocks: list[np.ndarray] = [
+            guesses[s : s + step] for s in range(0, len(guesses), step)
+        ]
+
+        def score(block: np.ndarray) -> np.ndarray:
+            rows: np.ndarray = np.asarray(matrix[np.ix_(block, answers)])
+            return sum(
+                EntropyCalc.get_entropies(rows[:, lo:hi])
+                for lo, hi in zip(bounds[:-1], bounds[1:])
+            )
+
+        if 1 < workers and 1 < len(blocks):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return np.concatenate(list(executor.map(score, blocks)))
+        return np.concatenate([score(block) for block in blocks])
+
+    @staticmethod
+    def get_ranked_boards(
+        matrix: np.ndarray,
+        guesses: np.ndarray,
+        boards: Sequence[np.ndarray],
+        k: int = 10,
+        workers: int = 1,
+    ) -> list[Tuple[int, float]]:
+        """Returns the top k guess ids for several boards as (id, score), scored by their
+        entropy summed over the boards plus the chance that they solve one (1 / n on each
+        board of n candidates they are one of). Ties go to the lower id."""
+        scores: np.ndarray = EntropyCalc.get_combined(
+            matrix, guesses, boards, workers=workers
+        )
+        for ids in boards:
+            if len(ids):
+                scores = scores + np.isin(guesses, ids) / len(ids)
+        return EntropyCalc.get_top(guesses, scores, np.zeros(len(guesses), dtype=bool), k)
+
+    @staticmethod
+    def get_ranked_batch(
+        matrix: np.ndarray,
+        problems: list[Tuple[np.ndarray, np.ndarray]],
+        k: int = 10,
+        max_elements: int = 1 << 22,
+    ) -> list[list[Tuple[int, float]]]:
+        """Returns get_ranked for each (guess ids, answer ids) problem, scoring problems
+        together: those with few candidates and the same guesses (or guessing among their
+        candidates) in one gather and pairwise comparison per candidate count, the rest in
+        one bincount per chunk of at most max_elements patterns (larger ones alone, as
+        get_scores does)."""
+        scores: list[np.ndarray | None] = [None] * len(problems)
+
+        # Few candidates, grouped by candidate count and guess list.
+        groups: dict[Tuple[int, int], list[int]] = {}
+        large: list[int] = []
+        for i, (guesses, answers) in enumerate(problems):
+            if not len(guesses):
+                scores[i] = np.zeros(0)
+            elif 0 < len(answers) <= EntropyCalc.PAIRWISE_LIMIT:
+                shared: int = -1 if guesses is answers else id(guesses)
+                groups.setdefault((len(answers), shared), []).append(i)
+            elif max_elements < len(guesses) * len(answers):
+                # Too large to share a chunk, scored alone in blocks of guesses.
+                scores[i] = EntropyCalc.get_scores(matrix, guesses, answers, max_elements)
+            else:
+                large.append(i)
+        for (n, shared), members in groups.items():
+            guess_count: int = n if shared == -1 else len(problems[members[0]][0])
+            step: int = max(1, max_elements // (guess_count * n * n))
+            for s in range(0, len(members), step):
+                part: list[int] = members[s : s + step]
+                answers: np.ndarray = np.stack([problems[i][1] for i in part])
+                rows: np.ndarray
+                if shared == -1:
+                    rows = np.asarray(matrix[answers[:, :, None], answers[:, None, :]])
+                else:
+                    rows = (
+                        np.asarray(matrix[np.ix_(problems[part[0]][0], answers.ravel())])
+                        .reshape(guess_count, len(part), n)
+                        .transpose(1, 0, 2)
+                    )
+                for i, score in zip(part, EntropyCalc.get_pairwise(rows)):
+                    scores[i] = score
+
+        # The rest, each problem's patterns renumbered to the ones that occur and each row
+        # given its own range of bins.
+        start: int = 0
+        while start < len(large):
+            end: int = start + 1
+            elements: int = problems[large[start]][0].size * problems[large[start]][1].size
+            while end < len(large) and elements + problems[large[end]][0].size * problems[
+                large[end]
+            ][1].size <= max_elements:
+                elements += problems[large[end]][0].size * problems[large[end]][1].size
+                end += 1
+
+            flat: list[np.ndarray] = []
+            row_starts: list[np.ndarray] = []
+            sizes: list[np.ndarray] = []
+            offset: int = 0
+            for i in large[start:end]:
+                guesses, answers = problems[i]
+                block, width = EntropyCalc.get_renumbered(
+                    np.asarray(matrix[np.ix_(guesses, answers)])
+                )
+                starts: np.ndarray = offset + np.arange(len(guesses)) * width
+                flat.append((block + starts[:, None]).ravel())
+                row_starts.append(starts)
+                sizes.append(np.full(len(guesses), len(answers)))
+                offset += len(guesses) * width
+            p_count: np.ndarray = np.bincount(np.concatenate(flat), minlength=offset)
+
+            # H = log2(n) - sum(c * log2(c)) / n, n per row.
+            n_rows: np.ndarray = np.maximum(np.concatenate(sizes), 1)
+            counts: np.ndarray = np.arange(int(n_rows.max()) + 1)
+            c_log_c: np.ndarray = counts * np.log2(np.maximum(counts, 1))
+            chunk_scores: np.ndarray = np.maximum(
+                np.log2(n_rows)
+                - np.add.reduceat(c_log_c[p_count], np.concatenate(row_starts))
+                / n_rows,
+                0.0,
+            )
+            row: int = 0
+            for i in large[start:end]:
+                scores[i] = chunk_scores[row : row + len(problems[i][0])]
+                row += len(problems[i][0])
+            start = end
+
+        results: list[list[Tuple[int, float]]] = []
+        for (guesses, answers), score in zip(problems, scores):
+            results.append(
+                EntropyCalc.get_top(guesses, score, np.isin(guesses, answers), k)
+            )
+        return results
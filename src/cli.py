@@ -0,0 +1,10 @@
+import sys
+from WordleSolver.cli import CLI
+
+
+def main() -> int:
+    return CLI.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())